@@ -1,13 +1,15 @@
 import logging
 import time
 import boto3
+import botocore.session
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from functools import lru_cache
+from functools import lru_cache, partial
 from botocore.exceptions import ClientError, WaiterError, EndpointConnectionError
 
 from awswipe.core.config import Config
-from awswipe.core.retry import retry_delete, SLEEP_LONG, SLEEP_SHORT
+from awswipe.core.retry import CLIENT_CONFIG, retry_delete, SLEEP_LONG, SLEEP_SHORT
 from awswipe.core.logging import timed
+from awswipe.resources.base import _client_lock, record_result
 from awswipe.resources.s3 import S3Cleaner
 from awswipe.resources.iam import IamCleaner
 from awswipe.resources.ec2 import EC2Cleaner
@@ -21,10 +23,15 @@ from awswipe.resources.sagemaker import SageMakerCleaner
 class SuperAWSResourceCleaner:
     def __init__(self, config: Config):
         self.config = config
-        self.session = boto3.session.Session()
+        # Every client built from this session, including the ad-hoc ones
+        # below, picks up the shared pool and adaptive retry settings.
+        botocore_session = botocore.session.get_session()
+        botocore_session.set_default_client_config(CLIENT_CONFIG)
+        self.session = boto3.session.Session(botocore_session=botocore_session)
         self.report = {}
+        self._clients = {}
         try:
-            sts = self.session.client('sts')
+            sts = self._client('sts')
             self.account_id = sts.get_caller_identity()['Account']
         except ClientError as e:
             logging.error("Error retrieving account ID: %s", e)
@@ -44,13 +51,7 @@ class SuperAWSResourceCleaner:
     def _record_result(self, resource_type, resource_id, success, message=''):
         if self.config.dry_run:
             return
-        if resource_type not in self.report:
-            self.report[resource_type] = {'deleted': [], 'failed': []}
-        if success:
-            self.report[resource_type]['deleted'].append(resource_id)
-        else:
-            msg = f"{resource_id} ({message})" if message else resource_id
-            self.report[resource_type]['failed'].append(msg)
+        record_result(self.report, resource_type, resource_id, success, message)
 
     def print_report(self):
         print('\n=== AWS Super Cleanup Report ===')
@@ -69,9 +70,26 @@ class SuperAWSResourceCleaner:
             else:
                 print('    None')
 
+    def _client(self, service, region=None):
+        """Return the cached client for (service, region), creating it once.
+
+        The legacy methods below run on the region and global worker threads
+        and share the session with every ResourceCleaner, so creation takes
+        the same lock as ResourceCleaner._client.
+        """
+        key = (service, region)
+        client = self._clients.get(key)
+        if client is None:
+            with _client_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self.session.client(service, region_name=region)
+                    self._clients[key] = client
+        return client
+
     @lru_cache(maxsize=1)
     def get_all_regions(self):
-        ec2 = self.session.client('ec2')
+        ec2 = self._client('ec2')
         try:
             regions = [r['RegionName'] for r in ec2.describe_regions()['Regions']]
             logging.info('Retrieved regions: %s', regions)
@@ -87,10 +105,9 @@ class SuperAWSResourceCleaner:
         graph = DependencyGraph()
         
         # Register cleaners and their prerequisites
-        # We map 'resource_type' string to the cleaner instance method
+        # We map 'resource_type' string to the cleaner instance method.
+        # S3 and IAM are global and run once from purge_aws, not per region.
         cleaners_map = {
-            's3': self.s3_cleaner, # Global, but maybe regional buckets?
-            'iam': self.iam_cleaner, # Global
             'ec2': self.ec2_cleaner,
             'ebs': self.ebs_cleaner,
             'lambda': self.lambda_cleaner,
@@ -98,75 +115,33 @@ class SuperAWSResourceCleaner:
             'asg': self.asg_cleaner,
             'vpc': self.vpc_cleaner,
             'sagemaker': self.sagemaker_cleaner,
-            # Add placeholders for others if they don't have cleaners yet but are dependencies
-            'rds': None,
-            'elasticache': None,
-            'efs': None,
         }
         
         # Add nodes to graph
         for name, cleaner in cleaners_map.items():
-            if cleaner:
-                graph.add_node(name, cleaner.prerequisites)
-            else:
-                # For placeholders, we assume no prerequisites for now, or we just don't add them
-                # If they are prerequisites of others, they will be added by add_node logic
-                pass
+            graph.add_node(name, cleaner.prerequisites)
 
-        execution_order = graph.get_execution_order()
-        logging.info(f"[{region}] Cleanup execution order: {execution_order}")
-        
-        for resource in execution_order:
-            if resource in cleaners_map and cleaners_map[resource]:
-                logging.info(f"[{region}] Cleaning {resource}")
-                cleaners_map[resource].cleanup(region)
-            elif hasattr(self, f'delete_{resource}'):
-                 # Fallback for legacy methods or placeholders that map to legacy methods
-                 # We need to ensure legacy methods are available or mapped
-                 logging.info(f"[{region}] Cleaning {resource} (legacy)")
-                 getattr(self, f'delete_{resource}')(region)
-            else:
-                 logging.debug(f"[{region}] No cleaner for {resource}, skipping")
-
-        # Legacy cleanup for things not in the graph yet
-        # We can keep the old list for things NOT in execution_order
-        # But for now, let's trust the graph for the main resources we migrated.
-        
-        # What about resources NOT in the graph but in the old list?
-        # 'kms_keys', 'efs', 'elasticache', 'rds', 'dynamodb', 'sqs', 'sns', 'codebuild_projects'
-        # We should add them to the graph or run them separately.
-        # Ideally, we migrate them to cleaners or add them to the graph with legacy mapping.
-        
+        # Resources still handled by legacy delete_* methods. RDS/ElastiCache/EFS
+        # live in VPCs, so VPCCleaner lists them as prerequisites; adding them
+        # here before sorting lets one pass run everything in order.
         legacy_resources = [
             'kms_keys', 'efs', 'elasticache', 'rds', 'dynamodb', 'sqs', 'sns', 'codebuild_projects'
         ]
-        # These usually don't have strong dependencies on the new stuff, except maybe VPC?
-        # RDS/ElastiCache/EFS are in VPC, so they should run BEFORE VPC.
-        # VPCCleaner depends on them.
-        # So we should add them to the graph.
-        
-        # Let's add them to the graph with empty prerequisites for now (or correct ones if known)
-        # And ensure we have a way to call them.
-        
-        # Update cleaners_map with legacy methods mapping if possible, or just handle in loop
-        # But 'delete_rds' expects 'region' arg.
-        
-        # Let's add them to the graph.
         for res in legacy_resources:
             graph.add_node(res, []) # Assume no prereqs for now
-            
-        # Re-calculate order
-        execution_order = graph.get_execution_order()
-        logging.info(f"[{region}] Final execution order: {execution_order}")
 
+        execution_order = graph.get_execution_order()
+        logging.info(f"[{region}] Cleanup execution order: {execution_order}")
+        
         for resource in execution_order:
-            if resource in cleaners_map and cleaners_map[resource]:
+            if resource in cleaners_map:
+                logging.info(f"[{region}] Cleaning {resource}")
                 cleaners_map[resource].cleanup(region)
             elif hasattr(self, f'delete_{resource}'):
+                logging.info(f"[{region}] Cleaning {resource} (legacy)")
                 getattr(self, f'delete_{resource}')(region)
-            elif hasattr(self, f'delete_{resource}_global'):
-                 # Some might be global? No, cleanup_region is regional.
-                 pass
+            else:
+                logging.debug(f"[{region}] No cleaner for {resource}, skipping")
 
     # --- Delegated Methods ---
     def delete_s3_buckets_global(self):
@@ -204,12 +179,12 @@ class SuperAWSResourceCleaner:
             if not self.is_service_available(region, 'eks'):
                 logging.info(f"[{region}] EKS not available, skipping")
                 continue
-            eks_client = self.session.client('eks', region_name=region)
+            eks_client = self._client('eks', region)
             try:
                 clusters = eks_client.list_clusters().get('clusters', [])
                 for c in clusters:
                     logging.info(f"[{region}] Deleting EKS cluster {c}")
-                    self.delete_eks_nodegroups(region, c)
+                    self._delete_cluster_nodegroups(eks_client, region, c)
                     success = True
                     if not self.config.dry_run:
                         try:
@@ -225,45 +200,73 @@ class SuperAWSResourceCleaner:
                 logging.error(f"[{region}] Error listing EKS clusters: {e}")
 
     def delete_eks_nodegroups(self, region, cluster_name=None):
-        eks_client = self.session.client('eks', region_name=region)
+        eks_client = self._client('eks', region)
         try:
             clusters = [cluster_name] if cluster_name else eks_client.list_clusters().get('clusters', [])
-            for cluster in clusters:
-                try:
-                    ngs = eks_client.list_nodegroups(clusterName=cluster).get('nodegroups', [])
-                    for ng in ngs:
-                        logging.info(f"[{region}] Deleting nodegroup {ng} in cluster {cluster}")
-                        if not self.config.dry_run:
-                            try:
-                                eks_client.delete_nodegroup(clusterName=cluster, nodegroupName=ng)
-                                self.wait_for_nodegroup_deletion(eks_client, region, cluster, ng)
-                            except ClientError as e:
-                                code = e.response.get('Error', {}).get('Code', '')
-                                if code != 'ResourceNotFoundException':
-                                    logging.error(f"[{region}] Failed to delete nodegroup {ng}: {e}")
-                        else:
-                            logging.info(f"[Dry-Run] Would delete nodegroup {ng}")
-                except ClientError as e:
-                    logging.error(f"[{region}] Error listing nodegroups for cluster {cluster}: {e}")
         except ClientError as e:
             logging.error(f"[{region}] EKS nodegroups cleanup failed: {e}")
+            return
+        for cluster in clusters:
+            self._delete_cluster_nodegroups(eks_client, region, cluster)
+
+    def _delete_cluster_nodegroups(self, eks_client, region, cluster):
+        try:
+            ngs = self._list_nodegroups(eks_client, cluster)
+        except ClientError as e:
+            logging.error(f"[{region}] Error listing nodegroups for cluster {cluster}: {e}")
+            return
+        if not ngs:
+            return
+
+        # Nodegroup deletions within a cluster are independent, so run them
+        # (and their waits) concurrently instead of one after another.
+        with ThreadPoolExecutor(max_workers=min(self.config.max_workers, len(ngs))) as executor:
+            futures = [executor.submit(self._delete_one_nodegroup, eks_client, region, cluster, ng)
+                       for ng in ngs]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logging.error(f"[{region}] Error deleting nodegroup in cluster {cluster}: {e}")
+
+    def _list_nodegroups(self, eks_client, cluster):
+        paginator = eks_client.get_paginator('list_nodegroups')
+        ngs = []
+        for page in paginator.paginate(clusterName=cluster):
+            ngs.extend(page.get('nodegroups', []))
+        return ngs
+
+    def _delete_one_nodegroup(self, eks_client, region, cluster, ng):
+        logging.info(f"[{region}] Deleting nodegroup {ng} in cluster {cluster}")
+        if self.config.dry_run:
+            logging.info(f"[Dry-Run] Would delete nodegroup {ng}")
+            return
+        try:
+            eks_client.delete_nodegroup(clusterName=cluster, nodegroupName=ng)
+            self.wait_for_nodegroup_deletion(eks_client, region, cluster, ng)
+        except eks_client.exceptions.ResourceNotFoundException:
+            pass
+        except ClientError as e:
+            logging.error(f"[{region}] Failed to delete nodegroup {ng}: {e}")
 
     def wait_for_nodegroup_deletion(self, eks_client, region, cluster, ng):
-        for _ in range(30):
-            try:
-                resp = eks_client.describe_nodegroup(clusterName=cluster, nodegroupName=ng)
-                status = resp['nodegroup']['status']
-                if status == 'DELETING':
-                    time.sleep(SLEEP_LONG)
-                else:
-                    return
-            except ClientError as e:
-                if 'NotFoundException' in str(e):
-                    return
-                else:
-                    logging.error(f"[{region}] Error checking nodegroup {ng}: {e}")
-                    return
-        logging.warning(f"[{region}] Timeout waiting for nodegroup {ng} deletion")
+        waiter = eks_client.get_waiter('nodegroup_deleted')
+        try:
+            waiter.wait(clusterName=cluster, nodegroupName=ng,
+                        WaiterConfig={'Delay': SLEEP_LONG, 'MaxAttempts': 30})
+        except WaiterError as e:
+            # A waiter that stopped on an API error carries the error code, and
+            # one that hit DELETE_FAILED carries the nodegroup status; one that
+            # simply ran out of attempts has neither.
+            last_response = e.last_response or {}
+            code = last_response.get('Error', {}).get('Code')
+            status = last_response.get('nodegroup', {}).get('status')
+            if code:
+                logging.error(f"[{region}] Error checking nodegroup {ng}: {code}")
+            elif status == 'DELETE_FAILED':
+                logging.error(f"[{region}] Nodegroup {ng} deletion failed (DELETE_FAILED)")
+            else:
+                logging.warning(f"[{region}] Timeout waiting for nodegroup {ng} deletion")
 
     def deregister_ssm_managed_instances(self, ssm):
         try:
@@ -272,7 +275,7 @@ class SuperAWSResourceCleaner:
                 instance_id = instance['InstanceId']
                 logging.info(f"Deregistering SSM managed instance {instance_id}")
                 if not self.config.dry_run:
-                    success = retry_delete(lambda: ssm.deregister_managed_instance(InstanceId=instance_id),
+                    success = retry_delete(partial(ssm.deregister_managed_instance, InstanceId=instance_id),
                                            f"Deregister SSM managed instance {instance_id}")
                     self._record_result('SSM Managed Instances', instance_id, success)
                 else:
@@ -281,7 +284,7 @@ class SuperAWSResourceCleaner:
             logging.error(f"Error deregistering SSM managed instances: {e}")
 
     def delete_aws_backup_vaults_global(self):
-        backup_client = self.session.client('backup')
+        backup_client = self._client('backup')
         try:
             vaults = backup_client.list_backup_vaults().get('BackupVaultList', [])
             for vault in vaults:
@@ -291,14 +294,14 @@ class SuperAWSResourceCleaner:
                     rp_id = rp['RecoveryPointArn']
                     logging.info(f"Deleting recovery point {rp_id} in vault {vault_name}")
                     if not self.config.dry_run:
-                        retry_delete(lambda: backup_client.delete_recovery_point(BackupVaultName=vault_name, RecoveryPointArn=rp_id),
+                        retry_delete(partial(backup_client.delete_recovery_point, BackupVaultName=vault_name, RecoveryPointArn=rp_id),
                                      f"Delete recovery point {rp_id}")
                     else:
                         logging.info(f"[Dry-Run] Would delete recovery point {rp_id}")
                 
                 logging.info(f"Deleting backup vault {vault_name}")
                 if not self.config.dry_run:
-                    success = retry_delete(lambda: backup_client.delete_backup_vault(BackupVaultName=vault_name),
+                    success = retry_delete(partial(backup_client.delete_backup_vault, BackupVaultName=vault_name),
                                            f"Delete backup vault {vault_name}")
                     self._record_result('AWS Backup Vaults', vault_name, success)
                 else:
@@ -307,7 +310,7 @@ class SuperAWSResourceCleaner:
             logging.error(f"Error deleting AWS Backup vaults: {e}")
 
     def delete_elastic_beanstalk_environments_global(self):
-        eb = self.session.client('elasticbeanstalk')
+        eb = self._client('elasticbeanstalk')
         try:
             envs = eb.describe_environments()['Environments']
             for env in envs:
@@ -315,7 +318,7 @@ class SuperAWSResourceCleaner:
                 env_name = env['EnvironmentName']
                 logging.info(f"Terminating Elastic Beanstalk environment {env_name} ({env_id})")
                 if not self.config.dry_run:
-                    success = retry_delete(lambda: eb.terminate_environment(EnvironmentName=env_name, TerminateResources=True),
+                    success = retry_delete(partial(eb.terminate_environment, EnvironmentName=env_name, TerminateResources=True),
                                            f"Terminate Elastic Beanstalk environment {env_name}")
                     self._record_result('Elastic Beanstalk Environments', env_name, success)
                 else:
@@ -325,7 +328,7 @@ class SuperAWSResourceCleaner:
 
     @timed
     def delete_global_accelerators_global(self):
-        ga = self.session.client('globalaccelerator', region_name='us-west-2')
+        ga = self._client('globalaccelerator', 'us-west-2')
         try:
             accelerators = ga.list_accelerators().get('Accelerators', [])
             for accelerator in accelerators:
@@ -352,7 +355,7 @@ class SuperAWSResourceCleaner:
             logging.error(f"Error listing Global Accelerators: {e}")
 
     def delete_route53_hosted_zones_global(self):
-        r53 = self.session.client('route53')
+        r53 = self._client('route53')
         try:
             zones = r53.list_hosted_zones().get('HostedZones', [])
             for zone in zones:
@@ -367,11 +370,11 @@ class SuperAWSResourceCleaner:
                 if not self.config.dry_run:
                     if changes:
                         logging.info(f"Deleting records for hosted zone {zone_id}")
-                        retry_delete(lambda: r53.change_resource_record_sets(HostedZoneId=zone_id,
-                                                                             ChangeBatch={'Changes': changes}),
+                        retry_delete(partial(r53.change_resource_record_sets, HostedZoneId=zone_id,
+                                             ChangeBatch={'Changes': changes}),
                                      f"Delete records in hosted zone {zone_id}")
                     logging.info(f"Deleting hosted zone {zone_id}")
-                    success = retry_delete(lambda: r53.delete_hosted_zone(Id=zone_id),
+                    success = retry_delete(partial(r53.delete_hosted_zone, Id=zone_id),
                                            f"Delete hosted zone {zone_id}")
                     self._record_result('Route53 Hosted Zones', zone_id, success)
                 else:
@@ -380,7 +383,7 @@ class SuperAWSResourceCleaner:
             logging.error(f"Error deleting Route53 hosted zones: {e}")
 
     def delete_cloudfront_distributions_global(self):
-        cf = self.session.client('cloudfront')
+        cf = self._client('cloudfront')
         try:
             distributions = cf.list_distributions().get('DistributionList', {}).get('Items', [])
             for dist in distributions:
@@ -393,13 +396,13 @@ class SuperAWSResourceCleaner:
                     if config.get('Enabled', True):
                         config['Enabled'] = False
                         logging.info(f"Disabling CloudFront distribution {dist_id}")
-                        retry_delete(lambda: cf.update_distribution(DistributionConfig=config, Id=dist_id, IfMatch=etag),
+                        retry_delete(partial(cf.update_distribution, DistributionConfig=config, Id=dist_id, IfMatch=etag),
                                      f"Disable CloudFront distribution {dist_id}")
                         time.sleep(SLEEP_LONG)
                     logging.info(f"Deleting CloudFront distribution {dist_id}")
                     config_resp = cf.get_distribution_config(Id=dist_id)
                     etag = config_resp['ETag']
-                    success = retry_delete(lambda: cf.delete_distribution(Id=dist_id, IfMatch=etag),
+                    success = retry_delete(partial(cf.delete_distribution, Id=dist_id, IfMatch=etag),
                                            f"Delete CloudFront distribution {dist_id}")
                     self._record_result('CloudFront Distributions', dist_id, success)
                 else:
@@ -414,7 +417,7 @@ class SuperAWSResourceCleaner:
                 model_arn = model['Arn']
                 logging.info(f"[{region}] Deleting Bedrock model {model_arn}")
                 if not self.config.dry_run:
-                    success = retry_delete(lambda: bedrock.delete_model(arn=model_arn), f"Delete Bedrock model {model_arn}")
+                    success = retry_delete(partial(bedrock.delete_model, arn=model_arn), f"Delete Bedrock model {model_arn}")
                     self._record_result('Bedrock Models', model_arn, success)
                 else:
                     logging.info(f"[Dry-Run] Would delete Bedrock model {model_arn}")
@@ -423,13 +426,13 @@ class SuperAWSResourceCleaner:
 
     def delete_codebuild_projects(self, region):
         try:
-            codebuild = self.session.client('codebuild', region_name=region)
+            codebuild = self._client('codebuild', region)
             projects = codebuild.list_projects().get('projects', [])
             for project in projects:
                 logging.info(f"[{region}] Deleting CodeBuild project {project}")
                 if not self.config.dry_run:
                     success = retry_delete(
-                        lambda: codebuild.delete_project(name=project),
+                        partial(codebuild.delete_project, name=project),
                         f"Delete CodeBuild project {project}"
                     )
                     self._record_result('CodeBuild Projects', project, success)
@@ -439,10 +442,10 @@ class SuperAWSResourceCleaner:
             logging.error(f"[{region}] Error deleting CodeBuild projects: {e}")
 
     def delete_apprunner_services(self, region):
+        if not self.is_service_available(region, 'apprunner'):
+            return
+        client = self._client('apprunner', region)
         try:
-            if not self.is_service_available(region, 'apprunner'):
-                return
-            client = self.session.client('apprunner', region_name=region)
             services = client.list_services().get('ServiceSummaryList', [])
             for svc in services:
                 if not self.config.dry_run:
@@ -453,13 +456,13 @@ class SuperAWSResourceCleaner:
         except client.exceptions.ResourceNotFoundException:
             pass
         except ClientError as e:
-            if e.response['Error']['Code'] == 'InternalFailure':
+            if e.response.get('Error', {}).get('Code') == 'InternalFailure':
                 logging.warning(f"[{region}] AppRunner temporary unavailable")
             else:
                 raise
 
     def delete_amplify_apps(self, region):
-        client = self.session.client('amplify', region_name=region)
+        client = self._client('amplify', region)
         try:
             apps = client.list_apps()['apps']
             for app in apps:
@@ -474,7 +477,7 @@ class SuperAWSResourceCleaner:
     @timed
     def delete_kms_keys(self, region):
         try:
-            kms_client = self.session.client('kms', region_name=region)
+            kms_client = self._client('kms', region)
             paginator = kms_client.get_paginator('list_keys')
             keys = []
             for page in paginator.paginate():
@@ -493,7 +496,7 @@ class SuperAWSResourceCleaner:
                             kms_client.disable_key(KeyId=key_id)
                             logging.info(f"[{region}] Scheduling KMS key {key_id} for deletion")
                             success = retry_delete(
-                                lambda: kms_client.schedule_key_deletion(KeyId=key_id, PendingWindowInDays=7),
+                                partial(kms_client.schedule_key_deletion, KeyId=key_id, PendingWindowInDays=7),
                                 f"Schedule KMS key {key_id} deletion"
                             )
                             self._record_result('KMS Keys', f"{key_id} ({region})", success)
@@ -518,6 +521,10 @@ class SuperAWSResourceCleaner:
         if self.config.dry_run:
             logging.info("Running in dry-run mode - no resources will be deleted")
 
+        # Regions run on threads rather than processes: the work is waiting on
+        # AWS (the GIL is released during socket I/O), request signing is a
+        # tiny fraction of it, and every cleaner shares this process's report,
+        # client cache and boto3 session, none of which can be pickled.
         with ThreadPoolExecutor(max_workers=min(20, len(regions))) as executor:
             future_map = {executor.submit(self.cleanup_region, r): r for r in regions}
             for fut in as_completed(future_map):
@@ -532,8 +539,7 @@ class SuperAWSResourceCleaner:
         with ThreadPoolExecutor(max_workers=10) as executor:
             futures = [
                 executor.submit(self.delete_eks_clusters_global),
-                executor.submit(self.delete_all_iam_roles_global),
-                executor.submit(self.delete_service_linked_roles_global),
+                executor.submit(self.iam_cleaner.cleanup),
                 executor.submit(self.delete_global_accelerators_global),
                 executor.submit(self.delete_route53_hosted_zones_global),
                 executor.submit(self.delete_cloudfront_distributions_global),
@@ -551,7 +557,7 @@ class SuperAWSResourceCleaner:
                 except Exception as ex:
                     logging.error(f"Global cleanup error: {ex}")
 
-        ssm_global = self.session.client('ssm')
+        ssm_global = self._client('ssm')
         self.deregister_ssm_managed_instances(ssm_global)
         self.delete_s3_buckets_global()
         logging.info('=== AWS Super Cleanup complete! ===')
@@ -572,7 +578,7 @@ class SuperAWSResourceCleaner:
     @lru_cache
     def is_service_available(self, region, service_name):
         try:
-            client = self.session.client('service-quotas', region_name=region)
+            client = self._client('service-quotas', region)
             client.list_services()
             return True
         except EndpointConnectionError:
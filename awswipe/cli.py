@@ -1,10 +1,13 @@
 """AWSwipe CLI entry point."""
 import argparse
+import dataclasses
 import logging
+import sys
 import time
 from awswipe.core.config import load_config
 from awswipe.core.logging import setup_logging, get_run_id
-from awswipe.cleaner import SuperAWSResourceCleaner
+
+COUNTDOWN_SECONDS = 5
 
 
 def parse_args():
@@ -19,9 +22,24 @@ def parse_args():
                         help='Actually delete resources (default: dry-run)')
     parser.add_argument('--interactive', '-i', action='store_true',
                         help='Interactive menu mode')
+    parser.add_argument('--no-countdown', action='store_true',
+                        help='Skip the safety delay before a live run (for CI)')
     return parser.parse_args()
 
 
+def countdown(seconds=COUNTDOWN_SECONDS):
+    """Give the user a chance to Ctrl+C before a live run starts."""
+    if not sys.stdout.isatty():
+        # Nobody is watching a ticker; wait once instead of redrawing it
+        logging.warning(f"Starting in {seconds}s... (Ctrl+C to cancel)")
+        time.sleep(seconds)
+        return
+    for i in range(seconds, 0, -1):
+        print(f"Starting in {i}s... (Ctrl+C to cancel)", end='\r')
+        time.sleep(1)
+    print(" " * 40, end='\r')
+
+
 def main():
     args = parse_args()
     
@@ -34,31 +52,34 @@ def main():
     # Load config from file or defaults
     config = load_config(args.config)
     
-    # CLI args override config
+    # CLI args override config (on a copy; loaded configs are cached and shared)
+    overrides = {}
     if args.region:
-        config.regions = [args.region]
+        overrides['regions'] = (args.region,)
     if args.verbose:
-        config.verbosity = args.verbose
+        overrides['verbosity'] = args.verbose
     if args.json_logs:
-        config.json_logs = True
+        overrides['json_logs'] = True
     if args.live_run:
-        config.dry_run = False
+        overrides['dry_run'] = False
+    if overrides:
+        config = dataclasses.replace(config, **overrides)
     
     setup_logging(config.verbosity, config.json_logs)
     logging.info(f"AWSwipe run_id={get_run_id()} dry_run={config.dry_run}")
     
+    # Imported here so --help and config errors don't pay for loading boto3
+    from awswipe.cleaner import SuperAWSResourceCleaner
     cleaner = SuperAWSResourceCleaner(config)
     
     if not config.dry_run:
         logging.warning("LIVE RUN MODE - Resources WILL be deleted")
-        try:
-            for i in range(5, 0, -1):
-                print(f"Starting in {i}s... (Ctrl+C to cancel)", end='\r')
-                time.sleep(1)
-            print(" " * 40, end='\r')
-        except KeyboardInterrupt:
-            logging.info("Cancelled by user")
-            return
+        if not args.no_countdown:
+            try:
+                countdown()
+            except KeyboardInterrupt:
+                logging.info("Cancelled by user")
+                return
     
     cleaner.purge_aws()
 
@@ -1,51 +1,95 @@
 """YAML configuration loader with validation."""
-import os
+import fnmatch
+import functools
+import itertools
+import re
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import Dict, FrozenSet, Iterable, List, Optional, Any, Tuple
 
 import yaml
 
+# libyaml's C parser is much faster than the pure-Python one; fall back
+# when PyYAML was built without it.
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+# Configs are immutable once built: derived lookup tables are computed in
+# __post_init__ and shared cached instances must not change under callers.
+# __slots__ (Python 3.10+) also makes the hot `config.dry_run` reads cheaper.
+_DATACLASS_OPTS = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTS["slots"] = True
+
+
+def _derived():
+    """Field holding state computed in __post_init__ (not an init arg)."""
+    return field(default=None, init=False, repr=False, compare=False)
+
+
+@dataclass(**_DATACLASS_OPTS)
 class TagFilters:
     """Tag-based filtering rules."""
-    include: Dict[str, List[str]] = field(default_factory=dict)
-    exclude: Dict[str, List[str]] = field(default_factory=dict)
+    include: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+    exclude: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class Config:
     """AWSwipe configuration."""
-    regions: List[str] = field(default_factory=lambda: ["all"])
-    resource_types: List[str] = field(default_factory=lambda: ["all"])
+    regions: Tuple[str, ...] = ("all",)
+    resource_types: Tuple[str, ...] = ("all",)
     tag_filters: TagFilters = field(default_factory=TagFilters)
-    exclude_patterns: List[str] = field(default_factory=list)
+    exclude_patterns: Tuple[str, ...] = ()
     dry_run: bool = True
+    # VPC cleaner only: dry runs log one count per VPC resource type instead
+    # of every ID. Other cleaners keep logging each ID.
+    dry_run_summary_only: bool = False
     json_logs: bool = False
     verbosity: int = 0
+    # Concurrent delete calls per resource batch (and per EC2/EKS fan-out);
+    # lower it if AWS throttles. S3 and IAM use fixed pools sized to the
+    # client connection pool instead.
+    max_workers: int = 10
+
+    _exclude_re: Optional[re.Pattern] = _derived()
+    _regions_set: FrozenSet[str] = _derived()
+    _resource_types_set: FrozenSet[str] = _derived()
+    _tag_include_sets: Dict[str, FrozenSet[str]] = _derived()
+    _tag_exclude_sets: Dict[str, FrozenSet[str]] = _derived()
+    _has_tag_filters: bool = _derived()
+
+    def __post_init__(self):
+        derive = functools.partial(object.__setattr__, self)
+        # Translate all glob patterns once into a single alternation regex
+        # so each name check is one C-level match instead of N fnmatch calls.
+        derive("_exclude_re", _compile_patterns(self.exclude_patterns))
+        # Membership checks run per resource; hash them once up front.
+        derive("_regions_set", frozenset(self.regions))
+        derive("_resource_types_set", frozenset(self.resource_types))
+        derive("_tag_include_sets", _tag_rule_sets(self.tag_filters.include))
+        derive("_tag_exclude_sets", _tag_rule_sets(self.tag_filters.exclude))
+        derive("_has_tag_filters", bool(self._tag_include_sets or self._tag_exclude_sets))
 
     def should_include_region(self, region: str) -> bool:
         """Check if region should be processed."""
-        if "all" in self.regions:
-            return True
-        return region in self.regions
+        return "all" in self._regions_set or region in self._regions_set
 
     def should_include_resource(self, resource_type: str) -> bool:
         """Check if resource type should be processed."""
-        if "all" in self.resource_types:
-            return True
-        return resource_type in self.resource_types
+        return "all" in self._resource_types_set or resource_type in self._resource_types_set
 
     def matches_tag_filters(self, tags: Dict[str, str]) -> bool:
         """Check if resource tags match include/exclude filters."""
+        if not self._has_tag_filters:
+            return True
         # Check exclude first
-        for key, values in self.tag_filters.exclude.items():
+        for key, values in self._tag_exclude_sets.items():
             if key in tags and tags[key] in values:
                 return False
         # Check include (if specified, at least one must match)
-        if self.tag_filters.include:
-            for key, values in self.tag_filters.include.items():
+        if self._tag_include_sets:
+            for key, values in self._tag_include_sets.items():
                 if key in tags and tags[key] in values:
                     return True
             return False
@@ -53,13 +97,35 @@ class Config:
 
     def matches_exclude_pattern(self, name: str) -> bool:
         """Check if resource name matches any exclude pattern."""
-        import fnmatch
-        return any(fnmatch.fnmatch(name, p) for p in self.exclude_patterns)
+        return self._exclude_re is not None and self._exclude_re.match(name) is not None
+
+    def filter_names(self, names: Iterable[str]) -> List[str]:
+        """Return the names that do not match any exclude pattern, in order."""
+        if self._exclude_re is None:
+            return list(names)
+        return list(itertools.filterfalse(self._exclude_re.match, names))
+
+
+def _tag_rule_sets(rules: Dict[str, Any]) -> Dict[str, FrozenSet[str]]:
+    """Convert ``{tag: values}`` rules to ``{tag: frozenset(values)}``."""
+    return {key: frozenset(values) for key, values in rules.items()}
+
+
+def _compile_patterns(patterns) -> Optional[re.Pattern]:
+    """Compile glob patterns into one regex, or None if there are none."""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
 
 
 def load_config(path: Optional[str] = None) -> Config:
     """Load config from YAML file or return defaults.
     
+    Parsed files are cached by path, modification time and size, so
+    repeated loads of an unchanged file return the same Config instance.
+    Callers must treat it as read-only (use ``dataclasses.replace`` to
+    derive an overridden copy).
+    
     Args:
         path: Path to YAML config file. If None, returns default config.
     
@@ -77,26 +143,52 @@ def load_config(path: Optional[str] = None) -> Config:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
     
-    with open(config_path) as f:
-        data = yaml.safe_load(f) or {}
+    stat = config_path.stat()
+    return _load_config_file(str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_file(path: str, mtime_ns: int, size: int) -> Config:
+    """Read and parse a config file; the stat fields only key the cache."""
+    with open(path) as f:
+        data = yaml.load(f, Loader=Loader) or {}
     
     return _parse_config(data)
 
 
+load_config.cache_clear = _load_config_file.cache_clear
+
+
 def _parse_config(data: Dict[str, Any]) -> Config:
     """Parse config dict into Config dataclass."""
     tag_filters_data = data.get("tag_filters", {})
     tag_filters = TagFilters(
-        include=tag_filters_data.get("include", {}),
-        exclude=tag_filters_data.get("exclude", {}),
+        include=_parse_tag_rules(tag_filters_data.get("include", {})),
+        exclude=_parse_tag_rules(tag_filters_data.get("exclude", {})),
     )
     
     return Config(
-        regions=data.get("regions", ["all"]),
-        resource_types=data.get("resource_types", ["all"]),
+        regions=_as_tuple(data.get("regions", ["all"])),
+        resource_types=_as_tuple(data.get("resource_types", ["all"])),
         tag_filters=tag_filters,
-        exclude_patterns=data.get("exclude_patterns", []),
+        exclude_patterns=_as_tuple(data.get("exclude_patterns", [])),
         dry_run=data.get("dry_run", True),
+        dry_run_summary_only=data.get("dry_run_summary_only", False),
         json_logs=data.get("json_logs", False),
         verbosity=data.get("verbosity", 0),
+        max_workers=data.get("max_workers", 10),
     )
+
+
+def _as_tuple(values: Any) -> Tuple[str, ...]:
+    """Normalize a YAML list or scalar to a tuple.
+
+    A scalar (``regions: all``) becomes a one-element tuple rather than
+    being split into characters.
+    """
+    return (values,) if isinstance(values, str) else tuple(values)
+
+
+def _parse_tag_rules(rules: Dict[str, Any]) -> Dict[str, Tuple[str, ...]]:
+    """Normalize ``{tag: [values]}`` rules to tuples; scalars as in ``_as_tuple``."""
+    return {key: _as_tuple(values) for key, values in (rules or {}).items()}
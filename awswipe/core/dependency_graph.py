@@ -1,4 +1,6 @@
+from collections import defaultdict
 from typing import Dict, List, Set, Optional
+import heapq
 import logging
 
 class DependencyGraph:
@@ -14,42 +16,59 @@ class DependencyGraph:
         
         self.prerequisites: Dict[str, List[str]] = {} # Node -> List of Prerequisites
 
+        # Adjacency and in-degrees derived from `prerequisites`; rebuilt lazily
+        # only after the graph changes, so repeated sorts reuse them.
+        self._adj: Dict[str, List[str]] = defaultdict(list)
+        self._indeg_template: Dict[str, int] = {}
+        self._dirty = True
+
     def add_node(self, name: str, prerequisites: List[str]):
+        self._dirty = True
         self.nodes.add(name)
         self.prerequisites[name] = prerequisites
         for prereq in prerequisites:
             self.nodes.add(prereq)
 
-    def get_execution_order(self) -> List[str]:
+    def _build(self):
         # Build adjacency list for Kahn's algorithm
         # Graph where edge U -> V means U must run before V.
         # So if V has prerequisite U, we add edge U -> V.
-        adj: Dict[str, List[str]] = {node: [] for node in self.nodes}
-        in_degree: Dict[str, int] = {node: 0 for node in self.nodes}
+        adj: Dict[str, List[str]] = defaultdict(list)
+        in_degree: Dict[str, int] = dict.fromkeys(self.nodes, 0)
 
         for node, prereqs in self.prerequisites.items():
             for prereq in prereqs:
                 adj[prereq].append(node)
                 in_degree[node] += 1
 
-        # Queue for nodes with no incoming edges (no prerequisites)
+        self._adj = adj
+        self._indeg_template = in_degree
+        self._dirty = False
+
+    def get_execution_order(self) -> List[str]:
+        if self._dirty:
+            self._build()
+        adj = self._adj
+        in_degree = self._indeg_template.copy()
+
+        # Min-heap of nodes with no incoming edges (no prerequisites).
+        # Popping the smallest name keeps the output deterministic when
+        # several nodes are ready at once, without re-sorting every step.
+        # A deque would also avoid list.pop(0), but its order would follow
+        # set iteration and could change between runs.
         queue = [node for node in self.nodes if in_degree[node] == 0]
-        # Sort queue for deterministic output if multiple nodes are ready
-        queue.sort()
+        heapq.heapify(queue)
         
         result = []
         
         while queue:
-            u = queue.pop(0)
+            u = heapq.heappop(queue)
             result.append(u)
             
-            for v in adj[u]:
+            for v in adj.get(u, ()):
                 in_degree[v] -= 1
                 if in_degree[v] == 0:
-                    queue.append(v)
-            
-            # Keep queue sorted for determinism
-            queue.sort()
+                    heapq.heappush(queue, v)
 
         if len(result) != len(self.nodes):
             # Cycle detected
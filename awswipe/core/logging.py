@@ -4,37 +4,58 @@ import logging
 import uuid
 import functools
 import time
-from datetime import datetime, timezone
-from typing import Optional
 
-_RUN_ID: Optional[str] = None
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _dumps = json.dumps
+
+_RUN_ID: str = uuid.uuid4().hex[:8]
+
+# Optional ``extra=`` fields copied into JSON entries, in output order
+_EXTRA_KEYS = ("region", "resource_type", "resource_id", "action")
 
 
 def get_run_id() -> str:
-    """Get or create the current run ID."""
-    global _RUN_ID
-    if _RUN_ID is None:
-        _RUN_ID = str(uuid.uuid4())[:8]
+    """Get the current run ID."""
     return _RUN_ID
 
 
 class JSONFormatter(logging.Formatter):
     """JSON log formatter with structured fields."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Records arrive in bursts within the same second; format the
+        # date/time part once per second and only append milliseconds.
+        self._ts_sec = -1
+        self._ts_str = ""
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        sec = int(record.created)
+        if sec != self._ts_sec:
+            self._ts_str = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._ts_sec = sec
+        return "%s.%03dZ" % (self._ts_str, record.msecs)
+
     def format(self, record: logging.LogRecord) -> str:
+        d = record.__dict__
         log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._timestamp(record),
             "level": record.levelname,
-            "run_id": get_run_id(),
+            "run_id": _RUN_ID,
             "message": record.getMessage(),
+            **{key: d[key] for key in _EXTRA_KEYS if key in d},
         }
-        # Add extra fields if present
-        for key in ("region", "resource_type", "resource_id", "action"):
-            if hasattr(record, key):
-                log_entry[key] = getattr(record, key)
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
-        return json.dumps(log_entry)
+        return _dumps(log_entry)
 
 
 def setup_logging(verbosity: int = 0, json_format: bool = False) -> None:
@@ -1,6 +1,7 @@
 import time
 import random
 import logging
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
 SLEEP_SHORT = 2
@@ -8,37 +9,61 @@ SLEEP_MEDIUM = 5
 SLEEP_LONG = 10
 SLEEP_EXTRA_LONG = 30
 
-def retry_delete(operation, description, max_attempts=8):
-    base_delay = 1.2
+MAX_DELAY = 60
+
+# Central client configuration. Throttling is handled first by botocore's
+# adaptive mode, whose client-side token bucket slows every worker sharing a
+# client; retry_delete below only sees throttles that outlast those attempts,
+# so it needs just a few backstop attempts of its own.
+# The pool is sized for the cleaners' concurrent delete batches.
+CLIENT_CONFIG = BotoConfig(
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+)
+
+_THROTTLE_CODES = frozenset(('Throttling', 'ThrottlingException', 'RequestLimitExceeded', 'TooManyRequestsException'))
+# Each retry_delete attempt already spans botocore's own retries
+RETRY_ATTEMPTS = 3
+# Backoff ceiling per attempt (1.2s, 2.4s, ... capped at MAX_DELAY)
+_BASE_DELAYS = tuple(min(1.2 * (2 ** i), MAX_DELAY) for i in range(16))
+
+def _modeled_throttle_errors(operation):
+    """Return the throttle exception classes modeled by the operation's client.
+
+    Works for bound client methods and functools.partial wrappers around them;
+    anything else yields an empty tuple and falls back to the error-code check.
+    """
+    func = getattr(operation, 'func', operation)
+    exceptions = getattr(getattr(func, '__self__', None), 'exceptions', None)
+    if exceptions is None:
+        return ()
+    return tuple(getattr(exceptions, name) for name in _THROTTLE_CODES if hasattr(exceptions, name))
+
+def retry_delete(operation, description, max_attempts=RETRY_ATTEMPTS):
+    throttle_errors = None
     for attempt in range(max_attempts):
         try:
             return operation()
         except ClientError as e:
-            code = e.response.get('Error', {}).get('Code', '')
-            if code in ['Throttling', 'RequestLimitExceeded']:
-                jitter = random.uniform(0.5, 1.5)
-                delay = min(base_delay * (2 ** attempt) * jitter, 60)
-                time.sleep(delay)
-            else:
+            if throttle_errors is None:
+                throttle_errors = _modeled_throttle_errors(operation)
+            # Not every service models its throttle error (EC2 does not), so
+            # unmatched errors still get the code check before being re-raised.
+            if not isinstance(e, throttle_errors) and e.response.get('Error', {}).get('Code') not in _THROTTLE_CODES:
                 raise
+            # Full jitter: concurrent workers throttled together spread their
+            # retries over the whole window instead of waking in step.
+            base = _BASE_DELAYS[min(attempt, len(_BASE_DELAYS) - 1)]
+            time.sleep(random.uniform(0, base))
     raise Exception(f"Max retries ({max_attempts}) exceeded for {description}")
 
-def retry_delete_with_backoff(operation, description, max_attempts=8, base_delay=SLEEP_SHORT):
-    attempts = 0
-    while attempts < max_attempts:
-        try:
-            operation()
-            logging.info(f'{description} succeeded')
-            return True
-        except ClientError as e:
-            code = e.response.get('Error', {}).get('Code', '')
-            if code in ['Throttling', 'RequestLimitExceeded']:
-                delay = base_delay * (2 ** (attempts - 1)) + random.uniform(0, 1)
-                logging.warning(f'{description} failed with {code}; retrying in {delay:.2f} seconds...')
-                time.sleep(delay)
-            else:
-                logging.error(f'{description} failed: {e}')
-                return False
-        attempts += 1
-    logging.error(f'{description} failed after {max_attempts} attempts')
-    return False
+def retry_delete_with_backoff(operation, description, max_attempts=RETRY_ATTEMPTS):
+    """Like retry_delete, but logs the outcome and returns True/False instead of raising."""
+    try:
+        retry_delete(operation, description, max_attempts)
+    except Exception as e:
+        logging.error('%s failed: %s', description, e)
+        return False
+    logging.info('%s succeeded', description)
+    return True
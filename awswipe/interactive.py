@@ -7,7 +7,7 @@ from textual.screen import Screen
 from textual.binding import Binding
 from textual import on, work
 
-from awswipe.core.config import Config
+from awswipe.core.config import Config, TagFilters
 from awswipe.core.logging import setup_logging, get_run_id
 from awswipe.cleaner import SuperAWSResourceCleaner
 
@@ -204,8 +204,7 @@ class AWSwipeApp(App):
     
     @on(Button.Pressed, "#preview")
     def do_preview(self) -> None:
-        config = Config()
-        config.dry_run = True
+        config = Config(dry_run=True)
         self.run_cleanup(config)
     
     @on(Button.Pressed, "#region")
@@ -215,9 +214,7 @@ class AWSwipeApp(App):
         
         def on_region(region: str):
             def on_confirm():
-                config = Config()
-                config.dry_run = False
-                config.regions = [region]
+                config = Config(dry_run=False, regions=(region,))
                 self.run_cleanup(config)
             self.push_screen(ConfirmScreen(f"Delete ALL in {region}?", on_confirm))
         
@@ -226,45 +223,38 @@ class AWSwipeApp(App):
     @on(Button.Pressed, "#nuke")
     def do_nuke(self) -> None:
         def on_confirm():
-            config = Config()
-            config.dry_run = False
-            config.regions = ["all"]
+            config = Config(dry_run=False, regions=("all",))
             self.run_cleanup(config)
         self.push_screen(ConfirmScreen("DELETE EVERYTHING in ALL regions?", on_confirm))
     
     @on(Button.Pressed, "#compute")
     def do_compute(self) -> None:
         def on_confirm():
-            config = Config()
-            config.dry_run = False
-            config.resource_types = ["ec2", "lambda", "eks", "autoscaling"]
+            config = Config(dry_run=False, resource_types=("ec2", "lambda", "eks", "autoscaling"))
             self.run_cleanup(config)
         self.push_screen(ConfirmScreen("Delete compute resources?", on_confirm))
     
     @on(Button.Pressed, "#storage")
     def do_storage(self) -> None:
         def on_confirm():
-            config = Config()
-            config.dry_run = False
-            config.resource_types = ["s3", "ebs"]
+            config = Config(dry_run=False, resource_types=("s3", "ebs"))
             self.run_cleanup(config)
         self.push_screen(ConfirmScreen("Delete storage resources?", on_confirm))
     
     @on(Button.Pressed, "#network")
     def do_network(self) -> None:
         def on_confirm():
-            config = Config()
-            config.dry_run = False
-            config.resource_types = ["vpc", "elb", "route53"]
+            config = Config(dry_run=False, resource_types=("vpc", "elb", "route53"))
             self.run_cleanup(config)
         self.push_screen(ConfirmScreen("Delete networking resources?", on_confirm))
     
     @on(Button.Pressed, "#devtest")
     def do_devtest(self) -> None:
         def on_confirm():
-            config = Config()
-            config.dry_run = False
-            config.tag_filters.include = {"Environment": ["dev", "test", "sandbox"]}
+            config = Config(
+                dry_run=False,
+                tag_filters=TagFilters(include={"Environment": ("dev", "test", "sandbox")}),
+            )
             self.run_cleanup(config)
         self.push_screen(ConfirmScreen("Delete dev/test tagged resources?", on_confirm))
     
@@ -272,9 +262,7 @@ class AWSwipeApp(App):
     def do_custom(self) -> None:
         def on_types(types: list[str]):
             def on_confirm():
-                config = Config()
-                config.dry_run = False
-                config.resource_types = types
+                config = Config(dry_run=False, resource_types=tuple(types))
                 self.run_cleanup(config)
             self.push_screen(ConfirmScreen(f"Delete: {', '.join(types)}?", on_confirm))
         self.push_screen(ResourceSelectScreen(on_types))
@@ -1,7 +1,7 @@
 import logging
+from functools import partial
 from botocore.exceptions import ClientError
 from awswipe.resources.base import ResourceCleaner
-from awswipe.core.retry import retry_delete
 
 class ASGCleaner(ResourceCleaner):
     @property
@@ -14,60 +14,61 @@ class ASGCleaner(ResourceCleaner):
         self.delete_launch_templates(region)
 
     def delete_asgs(self, region):
-        asg_client = self.session.client('autoscaling', region_name=region)
+        asg_client = self._client('autoscaling', region)
         try:
             paginator = asg_client.get_paginator('describe_auto_scaling_groups')
             asgs = []
             for page in paginator.paginate():
-                asgs.extend(page['AutoScalingGroups'])
+                asgs.extend(self.config.filter_names(
+                    asg['AutoScalingGroupName'] for asg in page['AutoScalingGroups']
+                ))
             
-            for asg in asgs:
-                asg_name = asg['AutoScalingGroupName']
-                logging.info(f"[{region}] Deleting ASG {asg_name}")
+            tasks = []
+            for asg_name in asgs:
+                logging.info("[%s] Deleting ASG %s", region, asg_name)
                 if not self.config.dry_run:
-                    success = retry_delete(
-                        lambda: asg_client.delete_auto_scaling_group(AutoScalingGroupName=asg_name, ForceDelete=True),
-                        f"Delete ASG {asg_name}"
-                    )
-                    self._record_result('Auto Scaling Groups', asg_name, success)
+                    tasks.append((asg_name, partial(
+                        asg_client.delete_auto_scaling_group, AutoScalingGroupName=asg_name, ForceDelete=True
+                    )))
                 else:
-                    logging.info(f"[Dry-Run] Would delete ASG {asg_name}")
+                    logging.info("[Dry-Run] Would delete ASG %s", asg_name)
+            self._parallel_delete('Auto Scaling Groups', region, tasks)
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting ASGs: {e}")
+            logging.error("[%s] Error deleting ASGs: %s", region, e)
 
     def delete_launch_configurations(self, region):
-        asg_client = self.session.client('autoscaling', region_name=region)
+        asg_client = self._client('autoscaling', region)
         try:
-            lcs = asg_client.describe_launch_configurations().get('LaunchConfigurations', [])
-            for lc in lcs:
-                lc_name = lc['LaunchConfigurationName']
-                logging.info(f"[{region}] Deleting Launch Configuration {lc_name}")
-                if not self.config.dry_run:
-                    success = retry_delete(
-                        lambda: asg_client.delete_launch_configuration(LaunchConfigurationName=lc_name),
-                        f"Delete Launch Config {lc_name}"
-                    )
-                    self._record_result('Launch Configurations', lc_name, success)
-                else:
-                    logging.info(f"[Dry-Run] Would delete Launch Config {lc_name}")
+            paginator = asg_client.get_paginator('describe_launch_configurations')
+            for page in paginator.paginate():
+                tasks = []
+                for lc_name in self.config.filter_names(
+                    lc['LaunchConfigurationName'] for lc in page['LaunchConfigurations']
+                ):
+                    logging.info("[%s] Deleting Launch Configuration %s", region, lc_name)
+                    if not self.config.dry_run:
+                        tasks.append((lc_name, partial(
+                            asg_client.delete_launch_configuration, LaunchConfigurationName=lc_name
+                        )))
+                    else:
+                        logging.info("[Dry-Run] Would delete Launch Config %s", lc_name)
+                self._parallel_delete('Launch Configurations', region, tasks)
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting Launch Configurations: {e}")
+            logging.error("[%s] Error deleting Launch Configurations: %s", region, e)
 
     def delete_launch_templates(self, region):
-        ec2 = self.session.client('ec2', region_name=region)
+        ec2 = self._client('ec2', region)
         try:
-            lts = ec2.describe_launch_templates().get('LaunchTemplates', [])
-            for lt in lts:
-                lt_name = lt['LaunchTemplateName']
-                lt_id = lt['LaunchTemplateId']
-                logging.info(f"[{region}] Deleting Launch Template {lt_name}")
-                if not self.config.dry_run:
-                    success = retry_delete(
-                        lambda: ec2.delete_launch_template(LaunchTemplateId=lt_id),
-                        f"Delete Launch Template {lt_name}"
-                    )
-                    self._record_result('Launch Templates', lt_name, success)
-                else:
-                    logging.info(f"[Dry-Run] Would delete Launch Template {lt_name}")
+            paginator = ec2.get_paginator('describe_launch_templates')
+            for page in paginator.paginate():
+                lts = {lt['LaunchTemplateName']: lt['LaunchTemplateId'] for lt in page['LaunchTemplates']}
+                tasks = []
+                for lt_name in self.config.filter_names(lts):
+                    logging.info("[%s] Deleting Launch Template %s", region, lt_name)
+                    if not self.config.dry_run:
+                        tasks.append((lt_name, partial(ec2.delete_launch_template, LaunchTemplateId=lts[lt_name])))
+                    else:
+                        logging.info("[Dry-Run] Would delete Launch Template %s", lt_name)
+                self._parallel_delete('Launch Templates', region, tasks)
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting Launch Templates: {e}")
+            logging.error("[%s] Error deleting Launch Templates: %s", region, e)
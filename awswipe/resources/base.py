@@ -1,15 +1,54 @@
 from abc import ABC, abstractmethod
+import logging
+import threading
 import boto3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from botocore.exceptions import EndpointConnectionError
 from awswipe.core.config import Config
+from awswipe.core.retry import CLIENT_CONFIG, retry_delete
+
+# Regions are cleaned in parallel and every cleaner appends to one report
+_report_lock = threading.Lock()
+# All cleaners share one boto3 Session, so client creation is serialized
+# process-wide rather than per cleaner.
+_client_lock = threading.Lock()
+
+
+def record_result(report: Dict[str, Dict[str, List[str]]], resource_type, resource_id, success, message=''):
+    """Append a deletion outcome to the shared run report."""
+    if not success and message:
+        resource_id = f"{resource_id} ({message})"
+    with _report_lock:
+        entry = report.setdefault(resource_type, {'deleted': [], 'failed': []})
+        entry['deleted' if success else 'failed'].append(resource_id)
+
 
 class ResourceCleaner(ABC):
     def __init__(self, session: boto3.Session, config: Config, report: Dict[str, Dict[str, List[str]]]):
         self.session = session
         self.config = config
         self.report = report
+        self._clients: Dict[Tuple[str, Optional[str]], Any] = {}
+
+    def _client(self, service: str, region: Optional[str] = None):
+        """Return the cached boto3 client for (service, region), creating it once.
+
+        Building a client loads the service model and endpoint data, so
+        cleaners share one per service and region. Clients are thread-safe;
+        Session.client() is not, and every cleaner uses the same session,
+        hence the module-level lock around creation.
+        """
+        key = (service, region)
+        client = self._clients.get(key)
+        if client is None:
+            with _client_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self.session.client(service, region_name=region, config=CLIENT_CONFIG)
+                    self._clients[key] = client
+        return client
 
     def _record_result(self, resource_type, resource_id, success, message=''):
         # If dry-run, we might not want to record as "deleted", but for now we follow original logic
@@ -31,18 +70,60 @@ class ResourceCleaner(ABC):
              # "Dry-Run Report" is Ticket 06. So for now, we just follow existing behavior.
              return
 
-        if resource_type not in self.report:
-            self.report[resource_type] = {'deleted': [], 'failed': []}
-        if success:
-            self.report[resource_type]['deleted'].append(resource_id)
-        else:
-            msg = f"{resource_id} ({message})" if message else resource_id
-            self.report[resource_type]['failed'].append(msg)
+        record_result(self.report, resource_type, resource_id, success, message)
+
+    def _run_parallel(self, label: str, tasks: Iterable[Tuple[str, Callable[[], Any]]],
+                      max_workers: Optional[int] = None) -> Iterator[Tuple[str, Optional[Exception]]]:
+        """Run ``(item_id, operation)`` tasks through ``retry_delete`` on a bounded pool.
+
+        ``operation`` takes no arguments. Yields ``(item_id, error)`` as each
+        task finishes, where ``error`` is None on success; a failure never
+        cancels the rest of the batch. The pool holds at most ``max_workers``
+        threads, ``config.max_workers`` by default.
+        """
+        tasks = list(tasks)
+        if not tasks:
+            return
+
+        limit = max_workers or self.config.max_workers
+        with ThreadPoolExecutor(max_workers=min(limit, len(tasks))) as executor:
+            futures = {
+                executor.submit(retry_delete, operation, f"{label} {item_id}"): item_id
+                for item_id, operation in tasks
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    yield futures[future], e
+                else:
+                    yield futures[future], None
+
+    def _parallel_delete(self, resource_type: str, region: Optional[str],
+                         tasks: Iterable[Tuple[str, Callable[[], Any]]]) -> List[str]:
+        """Delete resources concurrently and record each outcome.
+
+        Takes the same tasks as ``_run_parallel``; results are recorded under
+        ``resource_type`` and failures logged. Returns the IDs that were
+        deleted successfully.
+        """
+        tasks = list(tasks)
+        if tasks:
+            logging.info("[%s] Deleting %d %s", region, len(tasks), resource_type)
+        deleted = []
+        for resource_id, error in self._run_parallel(f"Delete {resource_type}", tasks):
+            if error is None:
+                self._record_result(resource_type, resource_id, True)
+                deleted.append(resource_id)
+            else:
+                logging.error("[%s] Failed to delete %s %s: %s", region, resource_type, resource_id, error)
+                self._record_result(resource_type, resource_id, False, str(error))
+        return deleted
 
     @lru_cache
     def is_service_available(self, region, service_name):
         try:
-            client = self.session.client(service_name, region_name=region)
+            self._client(service_name, region)
             # Try a lightweight call to check availability
             return True
         except EndpointConnectionError:
@@ -52,6 +133,13 @@ class ResourceCleaner(ABC):
 
     @property
     def prerequisites(self) -> List[str]:
+        """Resource types that must be cleaned in a region before this one.
+
+        The orchestrator runs ``cleanup(region)`` for many regions at once on
+        the same cleaner instance, so cleanup must keep per-region state in
+        locals and reach AWS only through ``_client``. An empty list means the
+        cleaner has no ordering constraints within a region.
+        """
         return []
 
     @abstractmethod
@@ -1,7 +1,7 @@
 import logging
+from functools import partial
 from botocore.exceptions import ClientError
 from awswipe.resources.base import ResourceCleaner
-from awswipe.core.retry import retry_delete
 
 class EBSCleaner(ResourceCleaner):
     @property
@@ -13,43 +13,35 @@ class EBSCleaner(ResourceCleaner):
         self.delete_snapshots(region)
 
     def delete_volumes(self, region):
-        ec2 = self.session.client('ec2', region_name=region)
+        ec2 = self._client('ec2', region)
         try:
             # Only delete available (unattached) volumes
-            volumes = ec2.describe_volumes(
-                Filters=[{'Name': 'status', 'Values': ['available']}]
-            ).get('Volumes', [])
-            
-            for vol in volumes:
-                v_id = vol['VolumeId']
-                logging.info(f"[{region}] Deleting EBS volume {v_id}")
-                if not self.config.dry_run:
-                    success = retry_delete(
-                        lambda: ec2.delete_volume(VolumeId=v_id),
-                        f"Delete EBS volume {v_id}"
-                    )
-                    self._record_result('EBS Volumes', v_id, success)
-                else:
-                    logging.info(f"[Dry-Run] Would delete EBS volume {v_id}")
+            paginator = ec2.get_paginator('describe_volumes')
+            for page in paginator.paginate(Filters=[{'Name': 'status', 'Values': ['available']}]):
+                tasks = []
+                for v_id in self.config.filter_names(vol['VolumeId'] for vol in page['Volumes']):
+                    logging.info("[%s] Deleting EBS volume %s", region, v_id)
+                    if not self.config.dry_run:
+                        tasks.append((v_id, partial(ec2.delete_volume, VolumeId=v_id)))
+                    else:
+                        logging.info("[Dry-Run] Would delete EBS volume %s", v_id)
+                self._parallel_delete('EBS Volumes', region, tasks)
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting EBS volumes: {e}")
+            logging.error("[%s] Error deleting EBS volumes: %s", region, e)
 
     def delete_snapshots(self, region):
-        ec2 = self.session.client('ec2', region_name=region)
+        ec2 = self._client('ec2', region)
         try:
             # Only delete snapshots owned by self
-            snapshots = ec2.describe_snapshots(OwnerIds=['self']).get('Snapshots', [])
-            
-            for snap in snapshots:
-                s_id = snap['SnapshotId']
-                logging.info(f"[{region}] Deleting EBS snapshot {s_id}")
-                if not self.config.dry_run:
-                    success = retry_delete(
-                        lambda: ec2.delete_snapshot(SnapshotId=s_id),
-                        f"Delete EBS snapshot {s_id}"
-                    )
-                    self._record_result('EBS Snapshots', s_id, success)
-                else:
-                    logging.info(f"[Dry-Run] Would delete EBS snapshot {s_id}")
+            paginator = ec2.get_paginator('describe_snapshots')
+            for page in paginator.paginate(OwnerIds=['self']):
+                tasks = []
+                for s_id in self.config.filter_names(snap['SnapshotId'] for snap in page['Snapshots']):
+                    logging.info("[%s] Deleting EBS snapshot %s", region, s_id)
+                    if not self.config.dry_run:
+                        tasks.append((s_id, partial(ec2.delete_snapshot, SnapshotId=s_id)))
+                    else:
+                        logging.info("[Dry-Run] Would delete EBS snapshot %s", s_id)
+                self._parallel_delete('EBS Snapshots', region, tasks)
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting EBS snapshots: {e}")
+            logging.error("[%s] Error deleting EBS snapshots: %s", region, e)
@@ -1,4 +1,6 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from botocore.exceptions import ClientError
 from awswipe.resources.base import ResourceCleaner
 from awswipe.core.retry import retry_delete
@@ -12,35 +14,36 @@ class EC2Cleaner(ResourceCleaner):
         self.terminate_instances(region)
 
     def terminate_instances(self, region):
-        ec2 = self.session.client('ec2', region_name=region)
+        ec2 = self._client('ec2', region)
         try:
             # Filter for instances that are not already terminated
             instances = ec2.describe_instances(
                 Filters=[{'Name': 'instance-state-name', 'Values': ['pending', 'running', 'stopping', 'stopped']}]
             )
-            instance_ids = []
-            for reservation in instances.get('Reservations', []):
-                for instance in reservation.get('Instances', []):
-                    instance_ids.append(instance['InstanceId'])
+            instance_ids = self.config.filter_names(
+                instance['InstanceId']
+                for reservation in instances.get('Reservations', [])
+                for instance in reservation.get('Instances', [])
+            )
+            # Only the IDs are needed; don't keep the full reservations alive
+            # through the termination round-trips below.
+            del instances
             
             if not instance_ids:
                 return
 
-            logging.info(f"[{region}] Terminating EC2 instances: {instance_ids}")
+            logging.info("[%s] Terminating EC2 instances: %s", region, instance_ids)
             
             if not self.config.dry_run:
-                # Check for termination protection
-                for i_id in instance_ids:
-                    try:
-                        attr = ec2.describe_instance_attribute(InstanceId=i_id, Attribute='disableApiTermination')
-                        if attr['DisableApiTermination']['Value']:
-                            logging.info(f"[{region}] Disabling termination protection for {i_id}")
-                            ec2.modify_instance_attribute(InstanceId=i_id, DisableApiTermination={'Value': False})
-                    except ClientError as e:
-                        logging.warning(f"[{region}] Failed to check/disable termination protection for {i_id}: {e}")
+                # Check for termination protection. The attribute is only
+                # available per instance, so overlap the round-trips.
+                with ThreadPoolExecutor(max_workers=min(self.config.max_workers, len(instance_ids))) as executor:
+                    list(executor.map(
+                        partial(self._disable_termination_protection, ec2, region), instance_ids
+                    ))
 
                 success = retry_delete(
-                    lambda: ec2.terminate_instances(InstanceIds=instance_ids),
+                    partial(ec2.terminate_instances, InstanceIds=instance_ids),
                     f"Terminate instances {instance_ids}"
                 )
                 # We record result for each instance individually for better reporting
@@ -48,7 +51,16 @@ class EC2Cleaner(ResourceCleaner):
                     self._record_result('EC2 Instances', i_id, success)
             else:
                 for i_id in instance_ids:
-                    logging.info(f"[Dry-Run] Would terminate EC2 instance {i_id}")
+                    logging.info("[Dry-Run] Would terminate EC2 instance %s", i_id)
 
         except ClientError as e:
-            logging.error(f"[{region}] Error terminating EC2 instances: {e}")
+            logging.error("[%s] Error terminating EC2 instances: %s", region, e)
+
+    def _disable_termination_protection(self, ec2, region, i_id):
+        try:
+            attr = ec2.describe_instance_attribute(InstanceId=i_id, Attribute='disableApiTermination')
+            if attr['DisableApiTermination']['Value']:
+                logging.info("[%s] Disabling termination protection for %s", region, i_id)
+                ec2.modify_instance_attribute(InstanceId=i_id, DisableApiTermination={'Value': False})
+        except ClientError as e:
+            logging.warning("[%s] Failed to check/disable termination protection for %s: %s", region, i_id, e)
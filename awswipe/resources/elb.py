@@ -1,7 +1,8 @@
 import logging
+from functools import partial
 from botocore.exceptions import ClientError
 from awswipe.resources.base import ResourceCleaner
-from awswipe.core.retry import retry_delete, SLEEP_SHORT
+from awswipe.core.retry import SLEEP_SHORT
 import time
 
 class ELBCleaner(ResourceCleaner):
@@ -15,71 +16,69 @@ class ELBCleaner(ResourceCleaner):
         self.delete_load_balancers_v1(region)
 
     def delete_load_balancers_v2(self, region):
-        elbv2 = self.session.client('elbv2', region_name=region)
+        elbv2 = self._client('elbv2', region)
         try:
-            lbs = elbv2.describe_load_balancers().get('LoadBalancers', [])
-            for lb in lbs:
-                lb_arn = lb['LoadBalancerArn']
-                lb_name = lb['LoadBalancerName']
-                logging.info(f"[{region}] Deleting ELBv2 {lb_name}")
-                if not self.config.dry_run:
-                    # Disable deletion protection if enabled
-                    try:
-                        attrs = elbv2.describe_load_balancer_attributes(LoadBalancerArn=lb_arn)
-                        for attr in attrs.get('Attributes', []):
-                            if attr['Key'] == 'deletion_protection.enabled' and attr['Value'] == 'true':
-                                elbv2.modify_load_balancer_attributes(
-                                    LoadBalancerArn=lb_arn,
-                                    Attributes=[{'Key': 'deletion_protection.enabled', 'Value': 'false'}]
-                                )
-                    except ClientError:
-                        pass
-
-                    success = retry_delete(
-                        lambda: elbv2.delete_load_balancer(LoadBalancerArn=lb_arn),
-                        f"Delete ELBv2 {lb_name}"
-                    )
-                    self._record_result('Load Balancers (v2)', lb_name, success)
+            paginator = elbv2.get_paginator('describe_load_balancers')
+            for page in paginator.paginate():
+                lbs = {lb['LoadBalancerName']: lb['LoadBalancerArn'] for lb in page['LoadBalancers']}
+                tasks = []
+                for lb_name in self.config.filter_names(lbs):
+                    logging.info("[%s] Deleting ELBv2 %s", region, lb_name)
+                    if not self.config.dry_run:
+                        tasks.append((lb_name, partial(self._delete_load_balancer_v2, elbv2, lbs[lb_name])))
+                    else:
+                        logging.info("[Dry-Run] Would delete ELBv2 %s", lb_name)
+                if self._parallel_delete('Load Balancers (v2)', region, tasks):
                     # Wait a bit for deletion to propagate before deleting TGs
-                    time.sleep(SLEEP_SHORT) 
-                else:
-                    logging.info(f"[Dry-Run] Would delete ELBv2 {lb_name}")
+                    time.sleep(SLEEP_SHORT)
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting ELBv2: {e}")
+            logging.error("[%s] Error deleting ELBv2: %s", region, e)
 
-    def delete_target_groups(self, region):
-        elbv2 = self.session.client('elbv2', region_name=region)
+    def _delete_load_balancer_v2(self, elbv2, lb_arn):
+        # Disable deletion protection if enabled
         try:
-            tgs = elbv2.describe_target_groups().get('TargetGroups', [])
-            for tg in tgs:
-                tg_arn = tg['TargetGroupArn']
-                tg_name = tg['TargetGroupName']
-                logging.info(f"[{region}] Deleting Target Group {tg_name}")
-                if not self.config.dry_run:
-                    success = retry_delete(
-                        lambda: elbv2.delete_target_group(TargetGroupArn=tg_arn),
-                        f"Delete Target Group {tg_name}"
+            attrs = elbv2.describe_load_balancer_attributes(LoadBalancerArn=lb_arn)
+            for attr in attrs.get('Attributes', []):
+                if attr['Key'] == 'deletion_protection.enabled' and attr['Value'] == 'true':
+                    elbv2.modify_load_balancer_attributes(
+                        LoadBalancerArn=lb_arn,
+                        Attributes=[{'Key': 'deletion_protection.enabled', 'Value': 'false'}]
                     )
-                    self._record_result('Target Groups', tg_name, success)
-                else:
-                    logging.info(f"[Dry-Run] Would delete Target Group {tg_name}")
+        except ClientError:
+            pass
+        return elbv2.delete_load_balancer(LoadBalancerArn=lb_arn)
+
+    def delete_target_groups(self, region):
+        elbv2 = self._client('elbv2', region)
+        try:
+            paginator = elbv2.get_paginator('describe_target_groups')
+            for page in paginator.paginate():
+                tgs = {tg['TargetGroupName']: tg['TargetGroupArn'] for tg in page['TargetGroups']}
+                tasks = []
+                for tg_name in self.config.filter_names(tgs):
+                    logging.info("[%s] Deleting Target Group %s", region, tg_name)
+                    if not self.config.dry_run:
+                        tasks.append((tg_name, partial(elbv2.delete_target_group, TargetGroupArn=tgs[tg_name])))
+                    else:
+                        logging.info("[Dry-Run] Would delete Target Group %s", tg_name)
+                self._parallel_delete('Target Groups', region, tasks)
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting Target Groups: {e}")
+            logging.error("[%s] Error deleting Target Groups: %s", region, e)
 
     def delete_load_balancers_v1(self, region):
-        elb = self.session.client('elb', region_name=region)
+        elb = self._client('elb', region)
         try:
-            lbs = elb.describe_load_balancers().get('LoadBalancerDescriptions', [])
-            for lb in lbs:
-                lb_name = lb['LoadBalancerName']
-                logging.info(f"[{region}] Deleting CLB {lb_name}")
-                if not self.config.dry_run:
-                    success = retry_delete(
-                        lambda: elb.delete_load_balancer(LoadBalancerName=lb_name),
-                        f"Delete CLB {lb_name}"
-                    )
-                    self._record_result('Classic Load Balancers', lb_name, success)
-                else:
-                    logging.info(f"[Dry-Run] Would delete CLB {lb_name}")
+            paginator = elb.get_paginator('describe_load_balancers')
+            for page in paginator.paginate():
+                tasks = []
+                for lb_name in self.config.filter_names(
+                    lb['LoadBalancerName'] for lb in page['LoadBalancerDescriptions']
+                ):
+                    logging.info("[%s] Deleting CLB %s", region, lb_name)
+                    if not self.config.dry_run:
+                        tasks.append((lb_name, partial(elb.delete_load_balancer, LoadBalancerName=lb_name)))
+                    else:
+                        logging.info("[Dry-Run] Would delete CLB %s", lb_name)
+                self._parallel_delete('Classic Load Balancers', region, tasks)
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting CLBs: {e}")
+            logging.error("[%s] Error deleting CLBs: %s", region, e)
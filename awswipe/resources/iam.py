@@ -1,67 +1,105 @@
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from botocore.exceptions import ClientError
 from awswipe.resources.base import ResourceCleaner
-from awswipe.core.retry import retry_delete, SLEEP_SHORT
+from awswipe.core.retry import CLIENT_CONFIG, retry_delete
+
+# Roles deleted at once, and the policy removals each role runs concurrently.
+# A role thread blocks while its policy pool runs, so at most
+# ROLE_WORKERS * POLICY_WORKERS requests share the one IAM client; sizing the
+# inner pool from the connection pool keeps that within it, whatever
+# config.max_workers says.
+ROLE_WORKERS = 4
+POLICY_WORKERS = CLIENT_CONFIG.max_pool_connections // ROLE_WORKERS
+
+# Name prefixes of AWS-managed service-linked roles, which need their own delete call
+_SLR_PREFIXES = ('AWSServiceRoleFor',)
 
 class IamCleaner(ResourceCleaner):
     def cleanup(self, region=None):
-        # IAM is global
-        self.delete_all_iam_roles_global()
-        self.delete_service_linked_roles_global()
+        # IAM is global. A single list_roles scan streams every role to the
+        # workers as pages arrive, service-linked or not.
+        self._delete_roles(service_linked=True, others=True)
 
-    def delete_all_iam_roles_global(self):
-        iam = self.session.client('iam')
-        try:
-            roles = iam.list_roles().get('Roles', [])
-            for role in roles:
-                rname = role['RoleName']
-                if rname.startswith('AWSServiceRoleFor'):
-                    continue
+    def delete_all_iam_roles_global(self, roles=None):
+        """Delete every role except service-linked ones; lists roles unless given."""
+        self._delete_roles(roles, others=True)
+
+    def delete_service_linked_roles_global(self, roles=None):
+        """Delete service-linked roles; lists roles unless given."""
+        self._delete_roles(roles, service_linked=True)
+
+    def _delete_roles(self, roles=None, service_linked=False, others=False):
+        iam = self._client('iam')
+        futures = {}
+        with ThreadPoolExecutor(max_workers=ROLE_WORKERS) as executor:
+            try:
+                for role in self._iter_roles(iam) if roles is None else roles:
+                    rname = role['RoleName']
+                    if rname.startswith(_SLR_PREFIXES):
+                        if service_linked:
+                            futures[executor.submit(self._delete_service_linked_role, iam, rname)] = rname
+                    elif others:
+                        futures[executor.submit(self._delete_role, iam, rname)] = rname
+            except ClientError as e:
+                logging.error(f"Error listing IAM roles: {e}")
+            for future in as_completed(futures):
                 try:
-                    iam.get_role(RoleName=rname)
-                except ClientError as e:
-                    if e.response['Error']['Code'] == 'NoSuchEntity':
-                        continue
-                
-                self._remove_policies_from_role(iam, rname)
-                self._remove_role_from_instance_profiles(iam, rname)
-                
-                if not self.config.dry_run:
-                    success = True
-                    try:
-                        iam.delete_role(RoleName=rname)
-                    except ClientError as e:
-                        logging.error(f"Error deleting IAM role {rname}: {e}")
-                        success = False
-                    self._record_result('IAM Roles', rname, success)
-                    time.sleep(SLEEP_SHORT)
-                else:
-                    logging.info(f"[Dry-Run] Would delete IAM role {rname}")
+                    future.result()
+                except Exception as e:
+                    logging.error(f"Error deleting IAM role {futures[future]}: {e}")
 
+    def _delete_role(self, iam, rname):
+        # The role was just listed, so no get_role probe: a role removed in the
+        # meantime surfaces as NoSuchEntity from the calls below and is skipped.
+        try:
+            self._remove_policies_from_role(iam, rname)
+            self._remove_role_from_instance_profiles(iam, rname)
+            if self.config.dry_run:
+                logging.info(f"[Dry-Run] Would delete IAM role {rname}")
+                return
+            iam.delete_role(RoleName=rname)
+        except iam.exceptions.NoSuchEntityException:
+            return
         except ClientError as e:
-            logging.error(f"Error listing IAM roles: {e}")
+            logging.error(f"Error deleting IAM role {rname}: {e}")
+            self._record_result('IAM Roles', rname, False, str(e))
+            return
+        self._record_result('IAM Roles', rname, True)
+
+    @staticmethod
+    def _iter_roles(iam):
+        # list_roles returns 100 roles per page by default; ask for the maximum
+        paginator = iam.get_paginator('list_roles')
+        for page in paginator.paginate(PaginationConfig={'PageSize': 1000}):
+            yield from page['Roles']
 
     def _remove_policies_from_role(self, iam, role_name):
         try:
-            att_pols = iam.list_attached_role_policies(RoleName=role_name).get('AttachedPolicies', [])
-            for p in att_pols:
-                p_arn = p['PolicyArn']
-                if not self.config.dry_run:
-                    retry_delete(lambda: iam.detach_role_policy(RoleName=role_name, PolicyArn=p_arn), f"Detach policy {p_arn} from {role_name}")
-                else:
-                    logging.info(f"[Dry-Run] Would detach policy {p_arn} from {role_name}")
+            att_pols = [p['PolicyArn'] for p in iam.list_attached_role_policies(RoleName=role_name).get('AttachedPolicies', [])]
         except ClientError as e:
-            logging.error(f"Error detaching policies from {role_name}: {e}")
+            logging.error(f"Error listing attached policies of {role_name}: {e}")
+            att_pols = []
         try:
             inlines = iam.list_role_policies(RoleName=role_name).get('PolicyNames', [])
-            for pol in inlines:
-                if not self.config.dry_run:
-                    retry_delete(lambda: iam.delete_role_policy(RoleName=role_name, PolicyName=pol), f"Delete inline policy {pol} from {role_name}")
-                else:
-                    logging.info(f"[Dry-Run] Would delete inline policy {pol} from {role_name}")
         except ClientError as e:
-            logging.error(f"Error removing inline policies from {role_name}: {e}")
+            logging.error(f"Error listing inline policies of {role_name}: {e}")
+            inlines = []
+
+        if self.config.dry_run:
+            for p_arn in att_pols:
+                logging.info(f"[Dry-Run] Would detach policy {p_arn} from {role_name}")
+            for pol in inlines:
+                logging.info(f"[Dry-Run] Would delete inline policy {pol} from {role_name}")
+            return
+
+        # IAM accepts concurrent detaches on one role, so each policy is its own task
+        tasks = [(p_arn, partial(iam.detach_role_policy, RoleName=role_name, PolicyArn=p_arn)) for p_arn in att_pols]
+        tasks += [(pol, partial(iam.delete_role_policy, RoleName=role_name, PolicyName=pol)) for pol in inlines]
+        for policy, error in self._run_parallel(f"Remove policy from {role_name}:", tasks, POLICY_WORKERS):
+            if error is not None:
+                logging.error(f"Error removing policy {policy} from {role_name}: {error}")
 
     def _remove_role_from_instance_profiles(self, iam, role_name):
         paginator = iam.get_paginator('list_instance_profiles_for_role')
@@ -70,28 +108,20 @@ class IamCleaner(ResourceCleaner):
             for p in profiles:
                 p_name = p['InstanceProfileName']
                 if not self.config.dry_run:
-                    retry_delete(lambda: iam.remove_role_from_instance_profile(InstanceProfileName=p_name, RoleName=role_name), f"Remove {role_name} from {p_name}")
-                    success = retry_delete(lambda: iam.delete_instance_profile(InstanceProfileName=p_name), f"Delete instance profile {p_name}")
+                    retry_delete(partial(iam.remove_role_from_instance_profile, InstanceProfileName=p_name, RoleName=role_name), f"Remove {role_name} from {p_name}")
+                    success = retry_delete(partial(iam.delete_instance_profile, InstanceProfileName=p_name), f"Delete instance profile {p_name}")
                     self._record_result('Instance IAM Profiles', p_name, success)
                 else:
                     logging.info(f"[Dry-Run] Would remove role from instance profile {p_name} and delete profile")
 
-    def delete_service_linked_roles_global(self):
-        iam = self.session.client('iam')
+    def _delete_service_linked_role(self, iam, role_name):
+        logging.info(f"Deleting service-linked role {role_name}")
+        if self.config.dry_run:
+            logging.info(f"[Dry-Run] Would delete service-linked role {role_name}")
+            return
         try:
-            roles = iam.list_roles()['Roles']
-            for role in roles:
-                role_name = role['RoleName']
-                if role_name.startswith('AWSServiceRoleFor'):
-                    logging.info(f"Deleting service-linked role {role_name}")
-                    if not self.config.dry_run:
-                        try:
-                            iam.delete_service_linked_role(RoleName=role_name)
-                            self._record_result('Service-Linked Roles', role_name, True)
-                        except ClientError as e:
-                            logging.error(f"Error deleting service-linked role {role_name}: {e}")
-                            self._record_result('Service-Linked Roles', role_name, False, str(e))
-                    else:
-                        logging.info(f"[Dry-Run] Would delete service-linked role {role_name}")
+            iam.delete_service_linked_role(RoleName=role_name)
+            self._record_result('Service-Linked Roles', role_name, True)
         except ClientError as e:
-            logging.error(f"Error listing IAM roles for service-linked deletion: {e}")
+            logging.error(f"Error deleting service-linked role {role_name}: {e}")
+            self._record_result('Service-Linked Roles', role_name, False, str(e))
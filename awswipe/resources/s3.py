@@ -1,9 +1,21 @@
 import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from functools import partial
+from itertools import chain
 from botocore.exceptions import ClientError
 from awswipe.resources.base import ResourceCleaner
 from awswipe.core.retry import retry_delete
 from awswipe.core.logging import timed
 
+# Object deletes overlap with listing: pages keep streaming in while up to
+# MAX_IN_FLIGHT_BATCHES delete_objects calls are queued or running.
+DELETE_WORKERS = 8
+MAX_IN_FLIGHT_BATCHES = 32
+# Buckets emptied at once; BUCKET_WORKERS * DELETE_WORKERS stays within the
+# shared client's connection pool. These are fixed rather than following
+# config.max_workers, which could otherwise oversubscribe that pool.
+BUCKET_WORKERS = 4
+
 class S3Cleaner(ResourceCleaner):
     @timed
     def cleanup(self, region=None):
@@ -12,50 +24,103 @@ class S3Cleaner(ResourceCleaner):
         self.delete_s3_buckets_global()
 
     def delete_s3_buckets_global(self):
-        s3 = self.session.client('s3')
+        s3 = self._client('s3')
         try:
             buckets = s3.list_buckets().get('Buckets', [])
-            for bucket in buckets:
-                b_name = bucket['Name']
-                logging.info('Processing S3 bucket: %s', b_name)
-                self._empty_s3_bucket(s3, b_name)
-                
-                if not self.config.dry_run:
-                    success = retry_delete(lambda: s3.delete_bucket(Bucket=b_name), f"Delete S3 Bucket {b_name}")
-                    self._record_result('S3 Buckets', b_name, success, '' if success else 'Cannot delete bucket; may require MFA')
-                else:
-                    logging.info(f"[Dry-Run] Would delete bucket {b_name}")
-
         except ClientError as e:
             logging.error('Error listing S3 buckets: %s', e)
+            return
+        if not buckets:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(BUCKET_WORKERS, len(buckets))) as executor:
+            futures = {executor.submit(self._process_bucket, bucket): bucket['Name'] for bucket in buckets}
+            for future in as_completed(futures):
+                b_name = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logging.error('Error deleting S3 bucket %s: %s', b_name, e)
+                    self._record_result('S3 Buckets', b_name, False, str(e))
+
+    def _process_bucket(self, bucket):
+        b_name = bucket['Name']
+        s3 = self._bucket_client(bucket)
+        logging.info('Processing S3 bucket: %s', b_name)
+        self._empty_s3_bucket(s3, b_name)
+
+        if not self.config.dry_run:
+            retry_delete(partial(s3.delete_bucket, Bucket=b_name), f"Delete S3 Bucket {b_name}")
+            self._record_result('S3 Buckets', b_name, True)
+        else:
+            logging.info(f"[Dry-Run] Would delete bucket {b_name}")
+
+    def _bucket_client(self, bucket):
+        """Return an S3 client for the bucket's home region.
+
+        Calls against the global endpoint are redirected for buckets in other
+        regions, so per-region clients save a round-trip on every request.
+        """
+        region = bucket.get('BucketRegion')
+        if region is None:
+            try:
+                location = self._client('s3').get_bucket_location(Bucket=bucket['Name'])
+            except ClientError:
+                return self._client('s3')
+            # Legacy values: an empty constraint means us-east-1, 'EU' means eu-west-1
+            region = location.get('LocationConstraint') or 'us-east-1'
+            if region == 'EU':
+                region = 'eu-west-1'
+        return self._client('s3', region)
 
     def _empty_s3_bucket(self, s3, bucket_name):
         logging.info('Emptying bucket: %s', bucket_name)
         try:
-            uploads = s3.list_multipart_uploads(Bucket=bucket_name).get('Uploads', [])
-            for upload in uploads:
-                key, upload_id = upload['Key'], upload['UploadId']
-                if not self.config.dry_run:
-                    retry_delete(lambda: s3.abort_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload_id), f"Abort MPU for {key}")
-                else:
-                    logging.info(f"[Dry-Run] Would abort MPU for {key}")
+            for page in s3.get_paginator('list_multipart_uploads').paginate(Bucket=bucket_name):
+                for upload in page.get('Uploads', []):
+                    key, upload_id = upload['Key'], upload['UploadId']
+                    if not self.config.dry_run:
+                        retry_delete(partial(s3.abort_multipart_upload, Bucket=bucket_name, Key=key, UploadId=upload_id), f"Abort MPU for {key}")
+                    else:
+                        logging.info(f"[Dry-Run] Would abort MPU for {key}")
         except ClientError:
             pass
             
         paginator = s3.get_paginator('list_object_versions')
-        try:
-            for page in paginator.paginate(Bucket=bucket_name):
-                objs = [{'Key': v['Key'], 'VersionId': v['VersionId']} for v in page.get('Versions', [])]
-                objs += [{'Key': d['Key'], 'VersionId': d['VersionId']} for d in page.get('DeleteMarkers', [])]
-                while objs:
-                    batch = objs[:1000]
-                    del_objs = {'Objects': batch, 'Quiet': True}
-                    if not self.config.dry_run:
-                        success = retry_delete(lambda: s3.delete_objects(Bucket=bucket_name, Delete=del_objs), f"Deleting objects in {bucket_name}")
-                        if not success:
-                            break
-                    else:
-                        logging.info(f"[Dry-Run] Would delete {len(batch)} objects in {bucket_name}")
-                    objs = objs[1000:]
-        except ClientError as e:
-            logging.warning('Could not fully list/delete objects in %s: %s', bucket_name, e)
+        pending = set()
+        with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+            try:
+                for page in paginator.paginate(Bucket=bucket_name):
+                    objs = [
+                        {'Key': v['Key'], 'VersionId': v['VersionId']}
+                        for v in chain(page.get('Versions', ()), page.get('DeleteMarkers', ()))
+                    ]
+                    # A page holds up to 1000 versions plus 1000 delete markers,
+                    # so this is one or two delete_objects calls.
+                    for i in range(0, len(objs), 1000):
+                        batch = objs[i:i + 1000]
+                        if not self.config.dry_run:
+                            if len(pending) >= MAX_IN_FLIGHT_BATCHES:
+                                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                                self._check_delete_batches(done, bucket_name)
+                            pending.add(executor.submit(
+                                retry_delete,
+                                partial(s3.delete_objects, Bucket=bucket_name, Delete={'Objects': batch, 'Quiet': True}),
+                                f"Deleting objects in {bucket_name}"
+                            ))
+                        else:
+                            logging.info(f"[Dry-Run] Would delete {len(batch)} objects in {bucket_name}")
+            except ClientError as e:
+                logging.warning('Could not fully list/delete objects in %s: %s', bucket_name, e)
+            self._check_delete_batches(wait(pending).done, bucket_name)
+
+    def _check_delete_batches(self, futures, bucket_name):
+        for future in futures:
+            try:
+                errors = future.result().get('Errors', [])
+            except Exception as e:
+                logging.warning('Failed to delete a batch of objects in %s: %s', bucket_name, e)
+                continue
+            if errors:
+                logging.warning('%d objects in %s could not be deleted: %s',
+                                len(errors), bucket_name, errors[0].get('Message'))
@@ -1,77 +1,78 @@
 import logging
-import time
-from botocore.exceptions import ClientError
+from functools import partial
+from botocore.exceptions import ClientError, WaiterError
 from awswipe.resources.base import ResourceCleaner
-from awswipe.core.retry import retry_delete, SLEEP_SHORT
+from awswipe.core.retry import retry_delete
 
 class SageMakerCleaner(ResourceCleaner):
     """Cleaner for Amazon SageMaker resources (endpoints, notebook instances, domains)."""
     
-    prerequisites = []
-    
     def cleanup(self, region):
         if not self.is_service_available(region, 'sagemaker'):
             logging.info(f"[{region}] SageMaker not available, skipping")
             return
         
-        client = self.session.client('sagemaker', region_name=region)
+        client = self._client('sagemaker', region)
         
         self._delete_endpoints(client, region)
         self._delete_endpoint_configs(client, region)
         self._delete_models(client, region)
         self._delete_notebook_instances(client, region)
-        self._delete_apps(client, region)
-        self._delete_user_profiles(client, region)
-        self._delete_domains(client, region)
+
+        # Apps, user profiles and domains are removed in that order; list the
+        # domains once and hand the same snapshot to all three steps.
+        try:
+            domain_ids = [
+                domain['DomainId']
+                for page in client.get_paginator('list_domains').paginate()
+                for domain in page['Domains']
+            ]
+        except ClientError as e:
+            logging.error(f"[{region}] Error listing SageMaker domains: {e}")
+            return
+        self._delete_apps(client, region, domain_ids)
+        self._delete_user_profiles(client, region, domain_ids)
+        self._delete_domains(client, region, domain_ids)
     
     def _delete_endpoints(self, client, region):
         try:
-            endpoints = client.list_endpoints()['Endpoints']
-            for ep in endpoints:
-                name = ep['EndpointName']
+            names = [item['EndpointName'] for item in client.list_endpoints()['Endpoints']]
+            tasks = []
+            for name in names:
                 logging.info(f"[{region}] Deleting SageMaker endpoint {name}")
                 if not self.config.dry_run:
-                    success = retry_delete(
-                        lambda n=name: client.delete_endpoint(EndpointName=n),
-                        f"Delete SageMaker endpoint {name}"
-                    )
-                    self._record_result('SageMaker Endpoints', f"{name} ({region})", success)
+                    tasks.append((f"{name} ({region})", partial(client.delete_endpoint, EndpointName=name)))
                 else:
                     logging.info(f"[Dry-Run] Would delete SageMaker endpoint {name}")
+            self._parallel_delete('SageMaker Endpoints', region, tasks)
         except ClientError as e:
             logging.error(f"[{region}] Error listing SageMaker endpoints: {e}")
     
     def _delete_endpoint_configs(self, client, region):
         try:
-            configs = client.list_endpoint_configs()['EndpointConfigs']
-            for cfg in configs:
-                name = cfg['EndpointConfigName']
+            names = [item['EndpointConfigName'] for item in client.list_endpoint_configs()['EndpointConfigs']]
+            tasks = []
+            for name in names:
                 logging.info(f"[{region}] Deleting SageMaker endpoint config {name}")
                 if not self.config.dry_run:
-                    success = retry_delete(
-                        lambda n=name: client.delete_endpoint_config(EndpointConfigName=n),
-                        f"Delete SageMaker endpoint config {name}"
-                    )
-                    self._record_result('SageMaker Endpoint Configs', f"{name} ({region})", success)
+                    tasks.append((f"{name} ({region})", partial(client.delete_endpoint_config, EndpointConfigName=name)))
                 else:
                     logging.info(f"[Dry-Run] Would delete SageMaker endpoint config {name}")
+            self._parallel_delete('SageMaker Endpoint Configs', region, tasks)
         except ClientError as e:
             logging.error(f"[{region}] Error listing SageMaker endpoint configs: {e}")
     
     def _delete_models(self, client, region):
         try:
-            models = client.list_models()['Models']
-            for model in models:
-                name = model['ModelName']
+            names = [item['ModelName'] for item in client.list_models()['Models']]
+            tasks = []
+            for name in names:
                 logging.info(f"[{region}] Deleting SageMaker model {name}")
                 if not self.config.dry_run:
-                    success = retry_delete(
-                        lambda n=name: client.delete_model(ModelName=n),
-                        f"Delete SageMaker model {name}"
-                    )
-                    self._record_result('SageMaker Models', f"{name} ({region})", success)
+                    tasks.append((f"{name} ({region})", partial(client.delete_model, ModelName=name)))
                 else:
                     logging.info(f"[Dry-Run] Would delete SageMaker model {name}")
+            self._parallel_delete('SageMaker Models', region, tasks)
         except ClientError as e:
             logging.error(f"[{region}] Error listing SageMaker models: {e}")
     
@@ -92,7 +93,7 @@ class SageMakerCleaner(ResourceCleaner):
                     logging.info(f"[{region}] Deleting SageMaker notebook {name}")
                     if not self.config.dry_run:
                         success = retry_delete(
-                            lambda n=name: client.delete_notebook_instance(NotebookInstanceName=n),
+                            partial(client.delete_notebook_instance, NotebookInstanceName=name),
                             f"Delete SageMaker notebook {name}"
                         )
                         self._record_result('SageMaker Notebooks', f"{name} ({region})", success)
@@ -102,23 +103,27 @@ class SageMakerCleaner(ResourceCleaner):
             logging.error(f"[{region}] Error listing SageMaker notebooks: {e}")
     
     def _wait_notebook_stopped(self, client, name, region):
-        for _ in range(30):
-            try:
-                resp = client.describe_notebook_instance(NotebookInstanceName=name)
-                if resp['NotebookInstanceStatus'] == 'Stopped':
-                    return
-                time.sleep(SLEEP_SHORT)
-            except ClientError:
-                return
-        logging.warning(f"[{region}] Timeout waiting for notebook {name} to stop")
+        waiter = client.get_waiter('notebook_instance_stopped')
+        try:
+            waiter.wait(NotebookInstanceName=name,
+                        WaiterConfig={'Delay': 15, 'MaxAttempts': 40})
+        except WaiterError as e:
+            # The waiter also gives up when the notebook lands in Failed; only
+            # a response with neither an error nor that status is a timeout.
+            last_response = e.last_response or {}
+            code = last_response.get('Error', {}).get('Code')
+            if code:
+                logging.error(f"[{region}] Error checking notebook {name}: {code}")
+            elif last_response.get('NotebookInstanceStatus') == 'Failed':
+                logging.error(f"[{region}] Notebook {name} failed to stop (Failed)")
+            else:
+                logging.warning(f"[{region}] Timeout waiting for notebook {name} to stop")
     
-    def _delete_apps(self, client, region):
+    def _delete_apps(self, client, region, domain_ids):
         try:
-            domains = client.list_domains()['Domains']
-            for domain in domains:
-                domain_id = domain['DomainId']
-                apps = client.list_apps(DomainIdEquals=domain_id)['Apps']
-                for app in apps:
+            for domain_id in domain_ids:
+                pages = client.get_paginator('list_apps').paginate(DomainIdEquals=domain_id)
+                for app in (app for page in pages for app in page['Apps']):
                     if app['Status'] == 'Deleted':
                         continue
                     logging.info(f"[{region}] Deleting SageMaker app {app['AppName']} in domain {domain_id}")
@@ -137,40 +142,32 @@ class SageMakerCleaner(ResourceCleaner):
         except ClientError as e:
             logging.error(f"[{region}] Error listing SageMaker apps: {e}")
     
-    def _delete_user_profiles(self, client, region):
+    def _delete_user_profiles(self, client, region, domain_ids):
         try:
-            domains = client.list_domains()['Domains']
-            for domain in domains:
-                domain_id = domain['DomainId']
-                profiles = client.list_user_profiles(DomainIdEquals=domain_id)['UserProfiles']
-                for profile in profiles:
+            tasks = []
+            for domain_id in domain_ids:
+                pages = client.get_paginator('list_user_profiles').paginate(DomainIdEquals=domain_id)
+                for profile in (profile for page in pages for profile in page['UserProfiles']):
                     name = profile['UserProfileName']
                     logging.info(f"[{region}] Deleting SageMaker user profile {name}")
                     if not self.config.dry_run:
-                        success = retry_delete(
-                            lambda d=domain_id, n=name: client.delete_user_profile(DomainId=d, UserProfileName=n),
-                            f"Delete SageMaker user profile {name}"
-                        )
-                        self._record_result('SageMaker User Profiles', f"{name} ({region})", success)
+                        tasks.append((f"{name} ({region})", partial(
+                            client.delete_user_profile, DomainId=domain_id, UserProfileName=name
+                        )))
+            self._parallel_delete('SageMaker User Profiles', region, tasks)
         except ClientError as e:
             logging.error(f"[{region}] Error listing SageMaker user profiles: {e}")
     
-    def _delete_domains(self, client, region):
-        try:
-            domains = client.list_domains()['Domains']
-            for domain in domains:
-                domain_id = domain['DomainId']
-                logging.info(f"[{region}] Deleting SageMaker domain {domain_id}")
-                if not self.config.dry_run:
-                    success = retry_delete(
-                        lambda d=domain_id: client.delete_domain(
-                            DomainId=d,
-                            RetentionPolicy={'HomeEfsFileSystem': 'Delete'}
-                        ),
-                        f"Delete SageMaker domain {domain_id}"
-                    )
-                    self._record_result('SageMaker Domains', f"{domain_id} ({region})", success)
-                else:
-                    logging.info(f"[Dry-Run] Would delete SageMaker domain {domain_id}")
-        except ClientError as e:
-            logging.error(f"[{region}] Error listing SageMaker domains: {e}")
+    def _delete_domains(self, client, region, domain_ids):
+        tasks = []
+        for domain_id in domain_ids:
+            logging.info(f"[{region}] Deleting SageMaker domain {domain_id}")
+            if not self.config.dry_run:
+                tasks.append((f"{domain_id} ({region})", partial(
+                    client.delete_domain,
+                    DomainId=domain_id,
+                    RetentionPolicy={'HomeEfsFileSystem': 'Delete'}
+                )))
+            else:
+                logging.info(f"[Dry-Run] Would delete SageMaker domain {domain_id}")
+        self._parallel_delete('SageMaker Domains', region, tasks)
@@ -1,8 +1,37 @@
 import logging
-from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import chain
+from botocore.exceptions import ClientError, WaiterError
 from awswipe.resources.base import ResourceCleaner
-from awswipe.core.retry import retry_delete, SLEEP_SHORT
-import time
+from awswipe.core.retry import retry_delete
+
+# DeleteVpcEndpoints accepts at most 25 IDs per call
+ENDPOINT_BATCH_SIZE = 25
+
+# Default VPCs and network ACLs are excluded by EC2 itself; the default
+# security group has no such filter and is dropped by name while streaming.
+_NON_DEFAULT_VPCS = [{'Name': 'is-default', 'Values': ['false']}]
+_NON_DEFAULT_NACLS = [{'Name': 'default', 'Values': ['false']}]
+
+# Steps within a stage touch unrelated resources and run concurrently; a stage
+# starts only once the previous one has finished. NAT gateways and endpoints
+# hold ENIs in subnets, IGWs detach only after NATs release their public IPs,
+# and custom route tables and NACLs lose their subnet associations with the
+# subnets. Security groups are only deletable once those ENIs are gone.
+CLEANUP_STAGES = (
+    ('delete_nat_gateways', 'delete_vpc_endpoints', 'delete_peering_connections'),
+    ('delete_internet_gateways',),
+    ('delete_subnets',),
+    ('delete_route_tables', 'delete_network_acls', 'delete_security_groups'),
+    ('delete_vpcs',),
+)
+
+def _describe(ec2, operation, key, **kwargs):
+    # Paginates so large accounts see every item, not just the first page;
+    # items stream through page by page instead of being concatenated.
+    pages = ec2.get_paginator(operation).paginate(**kwargs)
+    return chain.from_iterable(page[key] for page in pages)
 
 class VPCCleaner(ResourceCleaner):
     @property
@@ -11,197 +40,247 @@ class VPCCleaner(ResourceCleaner):
         return ['ec2', 'ebs', 'lambda', 'elb', 'asg', 'rds', 'elasticache', 'efs']
 
     def cleanup(self, region=None):
-        self.delete_nat_gateways(region)
-        self.delete_internet_gateways(region)
-        self.delete_vpc_endpoints(region)
-        self.delete_peering_connections(region)
-        self.delete_subnets(region)
-        self.delete_route_tables(region)
-        self.delete_network_acls(region)
-        self.delete_security_groups(region)
-        self.delete_vpcs(region)
+        with ThreadPoolExecutor(max_workers=max(map(len, CLEANUP_STAGES))) as executor:
+            for stage in CLEANUP_STAGES:
+                futures = [executor.submit(getattr(self, step), region) for step in stage]
+                for future in futures:
+                    future.result()
+
+    def _log_dry_run(self, region, resource_type, noun, ids):
+        if self.config.dry_run_summary_only:
+            logging.info("[Dry-Run] [%s] Would delete %d %s", region, len(ids), resource_type)
+        else:
+            for resource_id in ids:
+                logging.info("[Dry-Run] Would delete %s %s", noun, resource_id)
 
     def delete_nat_gateways(self, region):
-        ec2 = self.session.client('ec2', region_name=region)
+        ec2 = self._client('ec2', region)
         try:
-            nats = ec2.describe_nat_gateways(Filters=[{'Name': 'state', 'Values': ['available', 'failed']}]).get('NatGateways', [])
-            for nat in nats:
-                nat_id = nat['NatGatewayId']
-                logging.info(f"[{region}] Deleting NAT Gateway {nat_id}")
-                if not self.config.dry_run:
-                    retry_delete(lambda: ec2.delete_nat_gateway(NatGatewayId=nat_id), f"Delete NAT {nat_id}")
-                    self._record_result('NAT Gateways', nat_id, True)
-                else:
-                    logging.info(f"[Dry-Run] Would delete NAT Gateway {nat_id}")
-            
-            # Wait for deletion if not dry run
-            if nats and not self.config.dry_run:
-                logging.info(f"[{region}] Waiting for NAT Gateways to delete...")
-                time.sleep(SLEEP_SHORT * 2) # Simple wait, ideally use waiter
+            nats = _describe(ec2, 'describe_nat_gateways', 'NatGateways',
+                             Filter=[{'Name': 'state', 'Values': ['available', 'failed']}])
+            nat_ids = [nat['NatGatewayId'] for nat in nats]
+            if self.config.dry_run:
+                self._log_dry_run(region, 'NAT Gateways', 'NAT Gateway', nat_ids)
+                return
+            tasks = []
+            for nat_id in nat_ids:
+                logging.debug("[%s] Deleting NAT Gateway %s", region, nat_id)
+                tasks.append((nat_id, partial(ec2.delete_nat_gateway, NatGatewayId=nat_id)))
+            deleted = self._parallel_delete('NAT Gateways', region, tasks)
+            if deleted:
+                self._wait_nat_gateways_deleted(ec2, deleted, region)
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting NAT Gateways: {e}")
+            logging.error("[%s] Error deleting NAT Gateways: %s", region, e)
+
+    def _wait_nat_gateways_deleted(self, ec2, nat_ids, region):
+        # Runs on the stage's worker thread, so endpoint and peering deletes
+        # proceed while the NAT gateways release their ENIs and public IPs.
+        logging.info("[%s] Waiting for NAT Gateways to delete...", region)
+        waiter = ec2.get_waiter('nat_gateway_deleted')
+        try:
+            waiter.wait(NatGatewayIds=nat_ids,
+                        WaiterConfig={'Delay': 5, 'MaxAttempts': 60})
+        except WaiterError as e:
+            code = (e.last_response or {}).get('Error', {}).get('Code')
+            if code:
+                logging.error("[%s] Error checking NAT Gateways %s: %s", region, nat_ids, code)
+            else:
+                logging.warning("[%s] Timeout waiting for NAT Gateways %s to delete", region, nat_ids)
 
     def delete_internet_gateways(self, region):
-        ec2 = self.session.client('ec2', region_name=region)
+        ec2 = self._client('ec2', region)
         try:
-            igws = ec2.describe_internet_gateways().get('InternetGateways', [])
-            for igw in igws:
-                igw_id = igw['InternetGatewayId']
-                for att in igw.get('Attachments', []):
-                    vpc_id = att['VpcId']
-                    logging.info(f"[{region}] Detaching IGW {igw_id} from {vpc_id}")
-                    if not self.config.dry_run:
-                        retry_delete(lambda: ec2.detach_internet_gateway(InternetGatewayId=igw_id, VpcId=vpc_id), f"Detach IGW {igw_id}")
-                    else:
-                        logging.info(f"[Dry-Run] Would detach IGW {igw_id}")
-                
-                logging.info(f"[{region}] Deleting IGW {igw_id}")
-                if not self.config.dry_run:
-                    success = retry_delete(lambda: ec2.delete_internet_gateway(InternetGatewayId=igw_id), f"Delete IGW {igw_id}")
-                    self._record_result('Internet Gateways', igw_id, success)
-                else:
-                    logging.info(f"[Dry-Run] Would delete IGW {igw_id}")
+            igws = {igw['InternetGatewayId']: [att['VpcId'] for att in igw.get('Attachments', [])]
+                    for igw in _describe(ec2, 'describe_internet_gateways', 'InternetGateways')}
+            if self.config.dry_run:
+                if not self.config.dry_run_summary_only:
+                    for igw_id, vpc_ids in igws.items():
+                        if vpc_ids:
+                            logging.info("[Dry-Run] Would detach IGW %s", igw_id)
+                self._log_dry_run(region, 'Internet Gateways', 'IGW', list(igws))
+                return
+            tasks = []
+            for igw_id, vpc_ids in igws.items():
+                logging.debug("[%s] Detaching and deleting IGW %s (attached to %s)", region, igw_id, vpc_ids)
+                tasks.append((igw_id, partial(self._detach_and_delete_igw, ec2, igw_id, vpc_ids)))
+            self._parallel_delete('Internet Gateways', region, tasks)
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting Internet Gateways: {e}")
+            logging.error("[%s] Error deleting Internet Gateways: %s", region, e)
+
+    @staticmethod
+    def _detach_and_delete_igw(ec2, igw_id, vpc_ids):
+        # Detach and delete must stay ordered per gateway; different gateways
+        # have no such ordering and run as separate tasks.
+        for vpc_id in vpc_ids:
+            retry_delete(partial(ec2.detach_internet_gateway, InternetGatewayId=igw_id, VpcId=vpc_id), f"Detach IGW {igw_id}")
+        return ec2.delete_internet_gateway(InternetGatewayId=igw_id)
 
     def delete_vpc_endpoints(self, region):
-        ec2 = self.session.client('ec2', region_name=region)
+        ec2 = self._client('ec2', region)
         try:
-            eps = ec2.describe_vpc_endpoints().get('VpcEndpoints', [])
-            if not eps:
+            ep_ids = [ep['VpcEndpointId'] for ep in _describe(ec2, 'describe_vpc_endpoints', 'VpcEndpoints')]
+            if self.config.dry_run:
+                self._log_dry_run(region, 'VPC Endpoints', 'VPC Endpoint', ep_ids)
                 return
-            ep_ids = [ep['VpcEndpointId'] for ep in eps]
-            logging.info(f"[{region}] Deleting VPC Endpoints: {ep_ids}")
-            if not self.config.dry_run:
-                success = retry_delete(lambda: ec2.delete_vpc_endpoints(VpcEndpointIds=ep_ids), f"Delete VPC Endpoints {ep_ids}")
-                for ep_id in ep_ids:
-                    self._record_result('VPC Endpoints', ep_id, success)
-            else:
-                logging.info(f"[Dry-Run] Would delete VPC Endpoints {ep_ids}")
+            if not ep_ids:
+                return
+            logging.info("[%s] Deleting %d VPC Endpoints", region, len(ep_ids))
+            logging.debug("[%s] VPC Endpoints: %s", region, ep_ids)
+            batches = {
+                f"batch {i // ENDPOINT_BATCH_SIZE + 1}": ep_ids[i:i + ENDPOINT_BATCH_SIZE]
+                for i in range(0, len(ep_ids), ENDPOINT_BATCH_SIZE)
+            }
+            tasks = [(label, partial(self._delete_endpoint_batch, ec2, batch)) for label, batch in batches.items()]
+            for label, error in self._run_parallel("Delete VPC Endpoints", tasks):
+                # A batch that raised outright failed as a whole
+                if error is not None:
+                    logging.error("[%s] Failed to delete VPC Endpoints %s: %s", region, batches[label], error)
+                    for ep_id in batches[label]:
+                        self._record_result('VPC Endpoints', ep_id, False, str(error))
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting VPC Endpoints: {e}")
+            logging.error("[%s] Error deleting VPC Endpoints: %s", region, e)
+
+    def _delete_endpoint_batch(self, ec2, ep_ids):
+        # The call succeeds even when individual endpoints could not be
+        # deleted; those are listed under Unsuccessful.
+        response = ec2.delete_vpc_endpoints(VpcEndpointIds=ep_ids)
+        failed = {item['ResourceId']: item['Error']['Message'] for item in response.get('Unsuccessful', [])}
+        for ep_id in ep_ids:
+            if ep_id in failed:
+                self._record_result('VPC Endpoints', ep_id, False, failed[ep_id])
+            else:
+                self._record_result('VPC Endpoints', ep_id, True)
+        return response
 
     def delete_peering_connections(self, region):
-        ec2 = self.session.client('ec2', region_name=region)
+        ec2 = self._client('ec2', region)
         try:
-            pcxs = ec2.describe_vpc_peering_connections().get('VpcPeeringConnections', [])
-            for pcx in pcxs:
-                pcx_id = pcx['VpcPeeringConnectionId']
-                logging.info(f"[{region}] Deleting VPC Peering Connection {pcx_id}")
-                if not self.config.dry_run:
-                    success = retry_delete(lambda: ec2.delete_vpc_peering_connection(VpcPeeringConnectionId=pcx_id), f"Delete Peering {pcx_id}")
-                    self._record_result('VPC Peering Connections', pcx_id, success)
-                else:
-                    logging.info(f"[Dry-Run] Would delete VPC Peering Connection {pcx_id}")
+            pcxs = _describe(ec2, 'describe_vpc_peering_connections', 'VpcPeeringConnections')
+            pcx_ids = [pcx['VpcPeeringConnectionId'] for pcx in pcxs]
+            if self.config.dry_run:
+                self._log_dry_run(region, 'VPC Peering Connections', 'VPC Peering Connection', pcx_ids)
+                return
+            tasks = []
+            for pcx_id in pcx_ids:
+                logging.debug("[%s] Deleting VPC Peering Connection %s", region, pcx_id)
+                tasks.append((pcx_id, partial(ec2.delete_vpc_peering_connection, VpcPeeringConnectionId=pcx_id)))
+            self._parallel_delete('VPC Peering Connections', region, tasks)
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting VPC Peering Connections: {e}")
+            logging.error("[%s] Error deleting VPC Peering Connections: %s", region, e)
 
     def delete_subnets(self, region):
-        ec2 = self.session.client('ec2', region_name=region)
+        ec2 = self._client('ec2', region)
         try:
-            subnets = ec2.describe_subnets().get('Subnets', [])
-            for subnet in subnets:
-                sn_id = subnet['SubnetId']
-                logging.info(f"[{region}] Deleting Subnet {sn_id}")
-                if not self.config.dry_run:
-                    success = retry_delete(lambda: ec2.delete_subnet(SubnetId=sn_id), f"Delete Subnet {sn_id}")
-                    self._record_result('Subnets', sn_id, success)
-                else:
-                    logging.info(f"[Dry-Run] Would delete Subnet {sn_id}")
+            sn_ids = [subnet['SubnetId'] for subnet in _describe(ec2, 'describe_subnets', 'Subnets')]
+            if self.config.dry_run:
+                self._log_dry_run(region, 'Subnets', 'Subnet', sn_ids)
+                return
+            tasks = []
+            for sn_id in sn_ids:
+                logging.debug("[%s] Deleting Subnet %s", region, sn_id)
+                tasks.append((sn_id, partial(ec2.delete_subnet, SubnetId=sn_id)))
+            self._parallel_delete('Subnets', region, tasks)
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting Subnets: {e}")
+            logging.error("[%s] Error deleting Subnets: %s", region, e)
 
     def delete_route_tables(self, region):
-        ec2 = self.session.client('ec2', region_name=region)
+        ec2 = self._client('ec2', region)
         try:
-            rts = ec2.describe_route_tables().get('RouteTables', [])
-            for rt in rts:
-                rt_id = rt['RouteTableId']
-                # Skip main route tables
-                is_main = any(assoc.get('Main', False) for assoc in rt.get('Associations', []))
-                if is_main:
+            # Main route tables go away with their VPC; every other table is
+            # stripped of its subnet associations and then deleted.
+            rt_ids = []
+            assocs_to_remove = []
+            for rt in _describe(ec2, 'describe_route_tables', 'RouteTables'):
+                assocs = rt.get('Associations', [])
+                if any(assoc.get('Main', False) for assoc in assocs):
                     continue
-                
-                # Delete associations first
-                for assoc in rt.get('Associations', []):
-                    if not assoc.get('Main', False):
-                        assoc_id = assoc['RouteTableAssociationId']
-                        if not self.config.dry_run:
-                            retry_delete(lambda: ec2.disassociate_route_table(AssociationId=assoc_id), f"Disassociate RT {rt_id}")
-                        else:
-                            logging.info(f"[Dry-Run] Would disassociate RT {rt_id}")
-
-                logging.info(f"[{region}] Deleting Route Table {rt_id}")
-                if not self.config.dry_run:
-                    success = retry_delete(lambda: ec2.delete_route_table(RouteTableId=rt_id), f"Delete RT {rt_id}")
-                    self._record_result('Route Tables', rt_id, success)
-                else:
-                    logging.info(f"[Dry-Run] Would delete Route Table {rt_id}")
+                rt_ids.append(rt['RouteTableId'])
+                assocs_to_remove.extend((assoc['RouteTableAssociationId'], rt['RouteTableId']) for assoc in assocs)
+
+            if self.config.dry_run:
+                if not self.config.dry_run_summary_only:
+                    for assoc_id, rt_id in assocs_to_remove:
+                        logging.info("[Dry-Run] Would disassociate RT %s", rt_id)
+                self._log_dry_run(region, 'Route Tables', 'Route Table', rt_ids)
+                return
+
+            # EC2 has no batch disassociate; all of them go out concurrently
+            # and finish before the first delete is issued.
+            disassociations = [(f"{rt_id} ({assoc_id})", partial(ec2.disassociate_route_table, AssociationId=assoc_id))
+                               for assoc_id, rt_id in assocs_to_remove]
+            for assoc, error in self._run_parallel("Disassociate RT", disassociations):
+                if error is not None:
+                    logging.error("[%s] Error disassociating RT %s: %s", region, assoc, error)
+
+            tasks = []
+            for rt_id in rt_ids:
+                logging.debug("[%s] Deleting Route Table %s", region, rt_id)
+                tasks.append((rt_id, partial(ec2.delete_route_table, RouteTableId=rt_id)))
+            self._parallel_delete('Route Tables', region, tasks)
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting Route Tables: {e}")
+            logging.error("[%s] Error deleting Route Tables: %s", region, e)
 
     def delete_network_acls(self, region):
-        ec2 = self.session.client('ec2', region_name=region)
+        ec2 = self._client('ec2', region)
         try:
-            nacls = ec2.describe_network_acls().get('NetworkAcls', [])
-            for nacl in nacls:
-                nacl_id = nacl['NetworkAclId']
-                if nacl['IsDefault']:
-                    continue
-                logging.info(f"[{region}] Deleting Network ACL {nacl_id}")
-                if not self.config.dry_run:
-                    success = retry_delete(lambda: ec2.delete_network_acl(NetworkAclId=nacl_id), f"Delete NACL {nacl_id}")
-                    self._record_result('Network ACLs', nacl_id, success)
-                else:
-                    logging.info(f"[Dry-Run] Would delete Network ACL {nacl_id}")
+            nacl_ids = [nacl['NetworkAclId'] for nacl in _describe(ec2, 'describe_network_acls', 'NetworkAcls', Filters=_NON_DEFAULT_NACLS)]
+            if self.config.dry_run:
+                self._log_dry_run(region, 'Network ACLs', 'Network ACL', nacl_ids)
+                return
+            tasks = []
+            for nacl_id in nacl_ids:
+                logging.debug("[%s] Deleting Network ACL %s", region, nacl_id)
+                tasks.append((nacl_id, partial(ec2.delete_network_acl, NetworkAclId=nacl_id)))
+            self._parallel_delete('Network ACLs', region, tasks)
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting Network ACLs: {e}")
+            logging.error("[%s] Error deleting Network ACLs: %s", region, e)
 
     def delete_security_groups(self, region):
-        ec2 = self.session.client('ec2', region_name=region)
+        ec2 = self._client('ec2', region)
         try:
-            sgs = ec2.describe_security_groups().get('SecurityGroups', [])
-            # First pass: remove all ingress/egress rules to break dependencies
-            for sg in sgs:
-                sg_id = sg['GroupId']
-                if sg['GroupName'] == 'default':
-                    continue
-                
-                if not self.config.dry_run:
-                    if sg.get('IpPermissions'):
-                        retry_delete(lambda: ec2.revoke_security_group_ingress(GroupId=sg_id, IpPermissions=sg['IpPermissions']), f"Revoke ingress {sg_id}")
-                    if sg.get('IpPermissionsEgress'):
-                        retry_delete(lambda: ec2.revoke_security_group_egress(GroupId=sg_id, IpPermissions=sg['IpPermissionsEgress']), f"Revoke egress {sg_id}")
-                else:
-                    logging.info(f"[Dry-Run] Would revoke rules for SG {sg_id}")
-
-            # Second pass: delete groups
-            for sg in sgs:
-                sg_id = sg['GroupId']
-                if sg['GroupName'] == 'default':
-                    continue
-                logging.info(f"[{region}] Deleting Security Group {sg_id}")
-                if not self.config.dry_run:
-                    success = retry_delete(lambda: ec2.delete_security_group(GroupId=sg_id), f"Delete SG {sg_id}")
-                    self._record_result('Security Groups', sg_id, success)
-                else:
-                    logging.info(f"[Dry-Run] Would delete Security Group {sg_id}")
+            non_default = [sg for sg in _describe(ec2, 'describe_security_groups', 'SecurityGroups')
+                           if sg['GroupName'] != 'default']
+            sg_ids = [sg['GroupId'] for sg in non_default]
+            # Revocations only for groups that actually have rules
+            ingress_work = [(sg['GroupId'], sg['IpPermissions']) for sg in non_default if sg.get('IpPermissions')]
+            egress_work = [(sg['GroupId'], sg['IpPermissionsEgress']) for sg in non_default if sg.get('IpPermissionsEgress')]
+            del non_default
+
+            if self.config.dry_run:
+                if not self.config.dry_run_summary_only:
+                    for sg_id in sg_ids:
+                        logging.info("[Dry-Run] Would revoke rules for SG %s", sg_id)
+                self._log_dry_run(region, 'Security Groups', 'Security Group', sg_ids)
+                return
+
+            revokes = [(f"ingress {sg_id}", partial(ec2.revoke_security_group_ingress, GroupId=sg_id, IpPermissions=perms))
+                       for sg_id, perms in ingress_work]
+            revokes += [(f"egress {sg_id}", partial(ec2.revoke_security_group_egress, GroupId=sg_id, IpPermissions=perms))
+                        for sg_id, perms in egress_work]
+            tasks = []
+            for sg_id in sg_ids:
+                logging.debug("[%s] Deleting Security Group %s", region, sg_id)
+                tasks.append((sg_id, partial(ec2.delete_security_group, GroupId=sg_id)))
+
+            # Groups can reference each other, so every revoke finishes before any delete
+            for rule, error in self._run_parallel("Revoke", revokes):
+                if error is not None:
+                    logging.error("[%s] Error revoking %s: %s", region, rule, error)
+            self._parallel_delete('Security Groups', region, tasks)
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting Security Groups: {e}")
+            logging.error("[%s] Error deleting Security Groups: %s", region, e)
 
     def delete_vpcs(self, region):
-        ec2 = self.session.client('ec2', region_name=region)
+        ec2 = self._client('ec2', region)
         try:
-            vpcs = ec2.describe_vpcs().get('Vpcs', [])
-            for vpc in vpcs:
-                vpc_id = vpc['VpcId']
-                if vpc['IsDefault']:
-                    continue # Skip default VPC for now, or make it configurable
-                logging.info(f"[{region}] Deleting VPC {vpc_id}")
-                if not self.config.dry_run:
-                    success = retry_delete(lambda: ec2.delete_vpc(VpcId=vpc_id), f"Delete VPC {vpc_id}")
-                    self._record_result('VPCs', vpc_id, success)
-                else:
-                    logging.info(f"[Dry-Run] Would delete VPC {vpc_id}")
+            vpc_ids = [vpc['VpcId'] for vpc in _describe(ec2, 'describe_vpcs', 'Vpcs', Filters=_NON_DEFAULT_VPCS)]
+            if self.config.dry_run:
+                self._log_dry_run(region, 'VPCs', 'VPC', vpc_ids)
+                return
+            tasks = []
+            for vpc_id in vpc_ids:
+                logging.debug("[%s] Deleting VPC %s", region, vpc_id)
+                tasks.append((vpc_id, partial(ec2.delete_vpc, VpcId=vpc_id)))
+            self._parallel_delete('VPCs', region, tasks)
         except ClientError as e:
-            logging.error(f"[{region}] Error deleting VPCs: {e}")
+            logging.error("[%s] Error deleting VPCs: %s", region, e)
@@ -0,0 +1,150 @@
+import dataclasses
+import pytest
+from awswipe.core.config import Config, TagFilters, load_config
+
+
+def test_load_config_defaults():
+    config = load_config(None)
+    assert config == Config()
+
+
+def test_load_config_from_yaml(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "regions:\n"
+        "  - us-east-1\n"
+        "resource_types:\n"
+        "  - ec2\n"
+        "tag_filters:\n"
+        "  exclude:\n"
+        "    DoNotDelete: ['true']\n"
+        "exclude_patterns:\n"
+        "  - 'prod-*'\n"
+        "dry_run: false\n"
+        "dry_run_summary_only: true\n"
+        "max_workers: 4\n"
+    )
+
+    config = load_config(str(path))
+
+    assert list(config.regions) == ["us-east-1"]
+    assert list(config.resource_types) == ["ec2"]
+    assert list(config.tag_filters.exclude["DoNotDelete"]) == ["true"]
+    assert list(config.exclude_patterns) == ["prod-*"]
+    assert config.dry_run is False
+    assert config.dry_run_summary_only is True
+    assert config.max_workers == 4
+
+
+def test_load_config_scalar_tag_value(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "tag_filters:\n"
+        "  exclude:\n"
+        "    DoNotDelete: 'true'\n"
+    )
+
+    config = load_config(str(path))
+
+    assert list(config.tag_filters.exclude["DoNotDelete"]) == ["true"]
+    assert config.matches_tag_filters({"DoNotDelete": "true"}) is False
+
+
+def test_load_config_scalar_all(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "regions: all\n"
+        "resource_types: all\n"
+        "exclude_patterns: 'prod-*'\n"
+    )
+
+    config = load_config(str(path))
+
+    assert config.regions == ("all",)
+    assert config.resource_types == ("all",)
+    assert config.should_include_region("eu-west-1")
+    assert config.should_include_resource("vpc")
+    assert config.matches_exclude_pattern("prod-db")
+
+
+def test_load_config_empty_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("")
+    assert load_config(str(path)) == Config()
+
+
+def test_load_config_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_config(str(tmp_path / "missing.yaml"))
+
+
+def test_load_config_is_cached_until_file_changes(tmp_path):
+    load_config.cache_clear()
+    path = tmp_path / "config.yaml"
+    path.write_text("regions:\n  - us-east-1\n")
+
+    first = load_config(str(path))
+    assert load_config(str(path)) is first
+
+    path.write_text("regions:\n  - eu-west-1\n  - us-west-2\n")
+    second = load_config(str(path))
+    assert second is not first
+    assert second.regions == ("eu-west-1", "us-west-2")
+
+
+def test_matches_exclude_pattern():
+    config = Config(exclude_patterns=("prod-*", "*-critical", "exact"))
+
+    assert config.matches_exclude_pattern("prod-db")
+    assert config.matches_exclude_pattern("app-critical")
+    assert config.matches_exclude_pattern("exact")
+    assert not config.matches_exclude_pattern("exactly")
+    assert not config.matches_exclude_pattern("dev-db")
+    assert not Config().matches_exclude_pattern("prod-db")
+
+
+def test_region_and_resource_selection():
+    config = Config(regions=("us-east-1",), resource_types=("ec2", "s3"))
+
+    assert config.should_include_region("us-east-1")
+    assert not config.should_include_region("eu-west-1")
+    assert config.should_include_resource("s3")
+    assert not config.should_include_resource("vpc")
+    assert Config().should_include_region("eu-west-1")
+    assert Config().should_include_resource("vpc")
+
+
+def test_matches_tag_filters():
+    config = Config(tag_filters=TagFilters(
+        include={"Environment": ("dev", "test")},
+        exclude={"DoNotDelete": ("true",)},
+    ))
+
+    assert config.matches_tag_filters({"Environment": "dev"})
+    assert not config.matches_tag_filters({"Environment": "prod"})
+    assert not config.matches_tag_filters({"Environment": "dev", "DoNotDelete": "true"})
+    assert not config.matches_tag_filters({})
+
+
+def test_matches_tag_filters_without_filters():
+    assert Config().matches_tag_filters({})
+    assert Config().matches_tag_filters({"Environment": "prod"})
+
+
+def test_filter_names():
+    config = Config(exclude_patterns=("prod-*", "*-critical"))
+
+    assert config.filter_names(["prod-db", "dev-db", "app-critical", "test"]) == ["dev-db", "test"]
+    assert Config().filter_names(iter(["prod-db", "dev-db"])) == ["prod-db", "dev-db"]
+
+
+def test_config_is_immutable():
+    config = Config()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.dry_run = False
+
+    live = dataclasses.replace(config, dry_run=False, regions=("us-east-1",))
+    assert live.dry_run is False
+    assert live.should_include_region("us-east-1")
+    assert not live.should_include_region("eu-west-1")
+    assert config.dry_run is True
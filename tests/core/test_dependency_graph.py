@@ -54,3 +54,30 @@ def test_dependency_graph_cycle():
     # Should return all nodes even with cycle (fallback)
     assert set(order) == {'a', 'b'}
     assert len(order) == 2
+
+def test_dependency_graph_rebuilds_after_add_node():
+    graph = DependencyGraph()
+    graph.add_node('vpc', ['ec2'])
+    assert graph.get_execution_order() == ['ec2', 'vpc']
+    # Repeated calls reuse the cached adjacency and give the same answer
+    assert graph.get_execution_order() == ['ec2', 'vpc']
+
+    graph.add_node('ec2', ['asg'])
+    assert graph.get_execution_order() == ['asg', 'ec2', 'vpc']
+
+def test_dependency_graph_resource_matrix():
+    # The graph cleanup_region builds: cleaners plus legacy nodes
+    graph = DependencyGraph()
+    graph.add_node('ebs', ['ec2'])
+    graph.add_node('elb', ['ec2'])
+    graph.add_node('asg', ['ec2'])
+    graph.add_node('vpc', ['ec2', 'ebs', 'lambda', 'elb', 'asg', 'rds', 'elasticache', 'efs'])
+    for name in ('ec2', 'lambda', 'sagemaker', 'kms_keys', 'efs', 'elasticache', 'rds', 'dynamodb'):
+        graph.add_node(name, [])
+
+    order = graph.get_execution_order()
+
+    assert len(order) == len(set(order)) == 12
+    for prereq in graph.prerequisites['vpc']:
+        assert order.index(prereq) < order.index('vpc')
+    assert order == graph.get_execution_order()
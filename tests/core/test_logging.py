@@ -0,0 +1,48 @@
+import json
+import logging
+from awswipe.core.logging import JSONFormatter, get_run_id
+
+
+def _record(msg, created, **extra):
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, msg, (), None)
+    record.created = created
+    record.msecs = (created - int(created)) * 1000
+    record.__dict__.update(extra)
+    return record
+
+
+def test_get_run_id_is_stable():
+    assert get_run_id() == get_run_id()
+    assert len(get_run_id()) == 8
+
+
+def test_json_formatter_fields():
+    formatter = JSONFormatter()
+    entry = json.loads(formatter.format(
+        _record("Deleting vol-1", 0.25, region="us-east-1", resource_id="vol-1")
+    ))
+
+    assert entry["timestamp"] == "1970-01-01T00:00:00.250Z"
+    assert entry["level"] == "INFO"
+    assert entry["run_id"] == get_run_id()
+    assert entry["region"] == "us-east-1"
+    assert entry["resource_id"] == "vol-1"
+    assert "action" not in entry
+
+
+def test_json_formatter_timestamp_changes_with_second():
+    formatter = JSONFormatter()
+    first = json.loads(formatter.format(_record("a", 59.5)))
+    second = json.loads(formatter.format(_record("b", 60.0)))
+
+    assert first["timestamp"] == "1970-01-01T00:00:59.500Z"
+    assert second["timestamp"] == "1970-01-01T00:01:00.000Z"
+
+
+def test_json_formatter_extra_key_order():
+    formatter = JSONFormatter()
+    entry = json.loads(formatter.format(
+        _record("a", 0.0, action="delete", resource_type="EBS Volumes", region="us-east-1")
+    ))
+
+    assert list(entry)[4:] == ["region", "resource_type", "action"]
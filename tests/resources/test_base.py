@@ -0,0 +1,59 @@
+import pytest
+from unittest.mock import MagicMock
+from awswipe.resources.base import CLIENT_CONFIG, ResourceCleaner
+from awswipe.core.config import Config
+
+
+class DummyCleaner(ResourceCleaner):
+    def cleanup(self, region=None):
+        pass
+
+
+@pytest.fixture
+def mock_session():
+    session = MagicMock()
+    session.client.side_effect = lambda service, **kwargs: MagicMock(name=service)
+    return session
+
+
+def test_client_is_cached_per_service_and_region(mock_session):
+    cleaner = DummyCleaner(mock_session, Config(), {})
+
+    ec2 = cleaner._client('ec2', 'us-east-1')
+    assert cleaner._client('ec2', 'us-east-1') is ec2
+    assert cleaner._client('ec2', 'eu-west-1') is not ec2
+    assert cleaner._client('elbv2', 'us-east-1') is not ec2
+    assert mock_session.client.call_count == 3
+    assert mock_session.client.call_args.kwargs['config'] is CLIENT_CONFIG
+
+
+def test_parallel_delete_records_each_outcome(mock_session):
+    report = {}
+    cleaner = DummyCleaner(mock_session, Config(dry_run=False), report)
+
+    def fail():
+        raise ValueError("boom")
+
+    tasks = [('a', lambda: None), ('b', fail), ('c', lambda: None)]
+    deleted = cleaner._parallel_delete('Things', 'us-east-1', tasks)
+
+    assert sorted(deleted) == ['a', 'c']
+    assert sorted(report['Things']['deleted']) == ['a', 'c']
+    assert report['Things']['failed'] == ['b (boom)']
+
+
+def test_parallel_delete_empty_batch(mock_session):
+    report = {}
+    cleaner = DummyCleaner(mock_session, Config(dry_run=False), report)
+
+    assert cleaner._parallel_delete('Things', 'us-east-1', []) == []
+    assert report == {}
+
+def test_parallel_delete_logs_one_summary_line(mock_session, caplog):
+    cleaner = DummyCleaner(mock_session, Config(dry_run=False), {})
+    tasks = [(f"thing-{i}", MagicMock()) for i in range(5)]
+
+    with caplog.at_level('INFO'):
+        cleaner._parallel_delete('Things', 'us-east-1', tasks)
+
+    assert [r.getMessage() for r in caplog.records] == ['[us-east-1] Deleting 5 Things']
@@ -11,19 +11,22 @@ def mock_session():
 def mock_config():
     return Config(dry_run=False)
 
+def _mock_paginators(client, pages_by_operation):
+    def get_paginator(operation):
+        paginator = MagicMock()
+        paginator.paginate.return_value = pages_by_operation.get(operation, [])
+        return paginator
+    client.get_paginator.side_effect = get_paginator
+
 def test_ebs_cleanup(mock_session, mock_config):
     ec2_client = MagicMock()
     mock_session.client.return_value = ec2_client
     
-    # Mock describe_volumes
-    ec2_client.describe_volumes.return_value = {
-        'Volumes': [{'VolumeId': 'vol-123'}]
-    }
-    
-    # Mock describe_snapshots
-    ec2_client.describe_snapshots.return_value = {
-        'Snapshots': [{'SnapshotId': 'snap-456'}]
-    }
+    # Mock describe_volumes / describe_snapshots paginators
+    _mock_paginators(ec2_client, {
+        'describe_volumes': [{'Volumes': [{'VolumeId': 'vol-123'}]}],
+        'describe_snapshots': [{'Snapshots': [{'SnapshotId': 'snap-456'}]}],
+    })
     
     cleaner = EBSCleaner(mock_session, mock_config, {})
     cleaner.cleanup('us-east-1')
@@ -31,20 +34,66 @@ def test_ebs_cleanup(mock_session, mock_config):
     ec2_client.delete_volume.assert_called_with(VolumeId='vol-123')
     ec2_client.delete_snapshot.assert_called_with(SnapshotId='snap-456')
 
+def test_ebs_cleanup_all_pages(mock_session, mock_config):
+    ec2_client = MagicMock()
+    mock_session.client.return_value = ec2_client
+
+    _mock_paginators(ec2_client, {
+        'describe_volumes': [
+            {'Volumes': [{'VolumeId': 'vol-1'}]},
+            {'Volumes': [{'VolumeId': 'vol-2'}]},
+        ],
+    })
+
+    cleaner = EBSCleaner(mock_session, mock_config, {})
+    cleaner.cleanup('us-east-1')
+
+    deleted = sorted(c.kwargs['VolumeId'] for c in ec2_client.delete_volume.call_args_list)
+    assert deleted == ['vol-1', 'vol-2']
+
 def test_ebs_cleanup_dry_run(mock_session):
     config = Config(dry_run=True)
     ec2_client = MagicMock()
     mock_session.client.return_value = ec2_client
     
-    ec2_client.describe_volumes.return_value = {
-        'Volumes': [{'VolumeId': 'vol-123'}]
-    }
-    ec2_client.describe_snapshots.return_value = {
-        'Snapshots': [{'SnapshotId': 'snap-456'}]
-    }
+    _mock_paginators(ec2_client, {
+        'describe_volumes': [{'Volumes': [{'VolumeId': 'vol-123'}]}],
+        'describe_snapshots': [{'Snapshots': [{'SnapshotId': 'snap-456'}]}],
+    })
     
     cleaner = EBSCleaner(mock_session, config, {})
     cleaner.cleanup('us-east-1')
     
     ec2_client.delete_volume.assert_not_called()
     ec2_client.delete_snapshot.assert_not_called()
+
+def test_ebs_cleanup_skips_excluded(mock_session):
+    config = Config(dry_run=False, exclude_patterns=("vol-keep*",))
+    ec2_client = MagicMock()
+    mock_session.client.return_value = ec2_client
+
+    _mock_paginators(ec2_client, {
+        'describe_volumes': [{'Volumes': [{'VolumeId': 'vol-keep1'}, {'VolumeId': 'vol-123'}]}],
+    })
+
+    cleaner = EBSCleaner(mock_session, config, {})
+    cleaner.cleanup('us-east-1')
+
+    ec2_client.delete_volume.assert_called_once_with(VolumeId='vol-123')
+
+def test_dry_run_summary_only_does_not_apply_to_ebs(mock_session, caplog):
+    # dry_run_summary_only is documented as VPC-only; EBS still lists every ID
+    ec2_client = MagicMock()
+    mock_session.client.return_value = ec2_client
+    _mock_paginators(ec2_client, {
+        'describe_volumes': [{'Volumes': [{'VolumeId': 'vol-1'}, {'VolumeId': 'vol-2'}]}],
+    })
+
+    cleaner = EBSCleaner(mock_session, Config(dry_run=True, dry_run_summary_only=True), {})
+    with caplog.at_level('INFO'):
+        cleaner.delete_volumes('us-east-1')
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert "[Dry-Run] Would delete EBS volume vol-1" in messages
+    assert "[Dry-Run] Would delete EBS volume vol-2" in messages
+    ec2_client.delete_volume.assert_not_called()
@@ -0,0 +1,120 @@
+import threading
+import time
+import boto3
+import pytest
+from unittest.mock import MagicMock, patch
+from awswipe.core.retry import CLIENT_CONFIG
+from awswipe.resources.iam import IamCleaner
+from awswipe.core.config import Config
+
+@pytest.fixture
+def mock_session():
+    return MagicMock()
+
+def test_remove_policies_from_role(mock_session):
+    iam = MagicMock()
+    iam.list_attached_role_policies.return_value = {'AttachedPolicies': [
+        {'PolicyArn': 'arn:aws:iam::aws:policy/A'},
+        {'PolicyArn': 'arn:aws:iam::aws:policy/B'},
+    ]}
+    iam.list_role_policies.return_value = {'PolicyNames': ['inline-1']}
+
+    cleaner = IamCleaner(mock_session, Config(dry_run=False), {})
+    cleaner._remove_policies_from_role(iam, 'role')
+
+    detached = sorted(call.kwargs['PolicyArn'] for call in iam.detach_role_policy.call_args_list)
+    assert detached == ['arn:aws:iam::aws:policy/A', 'arn:aws:iam::aws:policy/B']
+    iam.delete_role_policy.assert_called_once_with(RoleName='role', PolicyName='inline-1')
+
+def test_remove_policies_from_role_dry_run(mock_session):
+    iam = MagicMock()
+    iam.list_attached_role_policies.return_value = {'AttachedPolicies': [{'PolicyArn': 'arn:a'}]}
+    iam.list_role_policies.return_value = {'PolicyNames': ['inline-1']}
+
+    cleaner = IamCleaner(mock_session, Config(dry_run=True), {})
+    cleaner._remove_policies_from_role(iam, 'role')
+
+    iam.detach_role_policy.assert_not_called()
+    iam.delete_role_policy.assert_not_called()
+
+def test_delete_roles_skips_vanished_role(mock_session):
+    iam = MagicMock()
+    iam.exceptions = boto3.client('iam', region_name='us-east-1').exceptions
+    mock_session.client.return_value = iam
+    iam.get_paginator.return_value.paginate.return_value = [{'Roles': [
+        {'RoleName': 'gone'}, {'RoleName': 'app'}, {'RoleName': 'AWSServiceRoleForX'},
+    ]}]
+    iam.list_attached_role_policies.return_value = {}
+    iam.list_role_policies.return_value = {}
+
+    def delete_role(RoleName):
+        if RoleName == 'gone':
+            raise iam.exceptions.NoSuchEntityException(
+                {'Error': {'Code': 'NoSuchEntity'}}, 'DeleteRole'
+            )
+    iam.delete_role.side_effect = delete_role
+
+    report = {}
+    cleaner = IamCleaner(mock_session, Config(dry_run=False), report)
+    with patch('time.sleep') as mock_sleep:
+        cleaner.delete_all_iam_roles_global()
+
+    mock_sleep.assert_not_called()
+    iam.get_role.assert_not_called()
+    assert report['IAM Roles'] == {'deleted': ['app'], 'failed': []}
+
+def test_cleanup_lists_roles_once(mock_session):
+    iam = MagicMock()
+    mock_session.client.return_value = iam
+    iam.list_attached_role_policies.return_value = {}
+    iam.list_role_policies.return_value = {}
+
+    def get_paginator(operation):
+        paginator = MagicMock()
+        if operation == 'list_roles':
+            paginator.paginate.return_value = [{'Roles': [
+                {'RoleName': 'app'}, {'RoleName': 'AWSServiceRoleForX'},
+            ]}]
+        else:
+            paginator.paginate.return_value = []
+        return paginator
+    iam.get_paginator.side_effect = get_paginator
+
+    cleaner = IamCleaner(mock_session, Config(dry_run=False), {})
+    cleaner.cleanup()
+
+    assert [c.args for c in iam.get_paginator.call_args_list].count(('list_roles',)) == 1
+    iam.delete_role.assert_called_once_with(RoleName='app')
+    iam.delete_service_linked_role.assert_called_once_with(RoleName='AWSServiceRoleForX')
+
+def test_policy_removal_stays_within_connection_pool(mock_session):
+    iam = MagicMock()
+    mock_session.client.return_value = iam
+    iam.get_paginator.return_value.paginate.return_value = [{'Roles': [
+        {'RoleName': f"role-{i}"} for i in range(8)
+    ]}]
+    iam.list_attached_role_policies.return_value = {'AttachedPolicies': [
+        {'PolicyArn': f"arn:aws:iam::aws:policy/P{i}"} for i in range(20)
+    ]}
+    iam.list_role_policies.return_value = {}
+
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def detach_role_policy(RoleName, PolicyArn):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+    iam.detach_role_policy.side_effect = detach_role_policy
+
+    # max_workers alone would allow ROLE_WORKERS * 40 concurrent detaches
+    cleaner = IamCleaner(mock_session, Config(dry_run=False, max_workers=40), {})
+    cleaner.delete_all_iam_roles_global()
+
+    assert iam.detach_role_policy.call_count == 8 * 20
+    assert 1 < peak <= CLIENT_CONFIG.max_pool_connections
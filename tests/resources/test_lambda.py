@@ -0,0 +1,48 @@
+import pytest
+from unittest.mock import MagicMock
+from awswipe.resources.lambda_ import LambdaCleaner
+from awswipe.core.config import Config
+
+@pytest.fixture
+def mock_session():
+    return MagicMock()
+
+def test_delete_functions_all_pages(mock_session):
+    client = MagicMock()
+    mock_session.client.return_value = client
+    client.get_paginator.return_value.paginate.return_value = [
+        {'Functions': [{'FunctionName': 'f1'}, {'FunctionName': 'f2'}]},
+        {'Functions': [{'FunctionName': 'f3'}]},
+    ]
+
+    report = {}
+    cleaner = LambdaCleaner(mock_session, Config(dry_run=False), report)
+    cleaner.delete_functions('us-east-1')
+
+    deleted = sorted(call.kwargs['FunctionName'] for call in client.delete_function.call_args_list)
+    assert deleted == ['f1', 'f2', 'f3']
+    assert sorted(report['Lambda Functions']['deleted']) == ['f1', 'f2', 'f3']
+
+def test_delete_layers_deletes_every_version(mock_session):
+    client = MagicMock()
+    mock_session.client.return_value = client
+
+    def get_paginator(operation):
+        paginator = MagicMock()
+        if operation == 'list_layers':
+            paginator.paginate.return_value = [{'Layers': [{'LayerName': 'deps'}]}]
+        else:
+            paginator.paginate.return_value = [
+                {'LayerVersions': [{'Version': 3}, {'Version': 2}]},
+                {'LayerVersions': [{'Version': 1}]},
+            ]
+        return paginator
+    client.get_paginator.side_effect = get_paginator
+
+    report = {}
+    cleaner = LambdaCleaner(mock_session, Config(dry_run=False), report)
+    cleaner.delete_layers('us-east-1')
+
+    versions = sorted(call.kwargs['VersionNumber'] for call in client.delete_layer_version.call_args_list)
+    assert versions == [1, 2, 3]
+    assert sorted(report['Lambda Layers']['deleted']) == ['deps:1', 'deps:2', 'deps:3']
@@ -0,0 +1,68 @@
+import pytest
+from unittest.mock import MagicMock
+from awswipe.resources import s3 as s3_module
+from awswipe.resources.s3 import S3Cleaner
+from awswipe.core.config import Config
+
+@pytest.fixture
+def mock_session():
+    return MagicMock()
+
+def _version_pages(pages, per_page):
+    return [
+        {'Versions': [{'Key': f'k{p}-{i}', 'VersionId': 'v1'} for i in range(per_page)]}
+        for p in range(pages)
+    ]
+
+def test_empty_bucket_deletes_every_page(mock_session, monkeypatch):
+    monkeypatch.setattr(s3_module, 'MAX_IN_FLIGHT_BATCHES', 2)
+    s3 = MagicMock()
+    s3.list_multipart_uploads.return_value = {}
+    s3.get_paginator.return_value.paginate.return_value = _version_pages(5, 3)
+    s3.delete_objects.return_value = {}
+
+    cleaner = S3Cleaner(mock_session, Config(dry_run=False), {})
+    cleaner._empty_s3_bucket(s3, 'bucket')
+
+    assert s3.delete_objects.call_count == 5
+    deleted = {
+        obj['Key']
+        for call in s3.delete_objects.call_args_list
+        for obj in call.kwargs['Delete']['Objects']
+    }
+    assert len(deleted) == 15
+
+def test_empty_bucket_dry_run(mock_session):
+    s3 = MagicMock()
+    s3.list_multipart_uploads.return_value = {}
+    s3.get_paginator.return_value.paginate.return_value = _version_pages(2, 3)
+
+    cleaner = S3Cleaner(mock_session, Config(dry_run=True), {})
+    cleaner._empty_s3_bucket(s3, 'bucket')
+
+    s3.delete_objects.assert_not_called()
+
+def test_buckets_use_regional_clients(mock_session):
+    clients = {}
+
+    def make_client(service, region_name=None, **kwargs):
+        client = MagicMock(name=f'{service}:{region_name}')
+        client.list_multipart_uploads.return_value = {}
+        client.get_paginator.return_value.paginate.return_value = []
+        clients[region_name] = client
+        return client
+
+    mock_session.client.side_effect = make_client
+    cleaner = S3Cleaner(mock_session, Config(dry_run=False), {})
+    global_s3 = cleaner._client('s3')
+    global_s3.list_buckets.return_value = {'Buckets': [
+        {'Name': 'a', 'BucketRegion': 'eu-west-1'},
+        {'Name': 'b'},
+    ]}
+    global_s3.get_bucket_location.return_value = {'LocationConstraint': None}
+
+    cleaner.delete_s3_buckets_global()
+
+    clients['eu-west-1'].delete_bucket.assert_called_once_with(Bucket='a')
+    clients['us-east-1'].delete_bucket.assert_called_once_with(Bucket='b')
+    assert sorted(cleaner.report['S3 Buckets']['deleted']) == ['a', 'b']
@@ -0,0 +1,58 @@
+import pytest
+from unittest.mock import MagicMock
+from botocore.exceptions import WaiterError
+from awswipe.resources.sagemaker import SageMakerCleaner
+from awswipe.core.config import Config
+
+@pytest.fixture
+def mock_session():
+    return MagicMock()
+
+def test_domains_listed_once(mock_session):
+    client = MagicMock()
+    mock_session.client.return_value = client
+    client.list_endpoints.return_value = {'Endpoints': []}
+    client.list_endpoint_configs.return_value = {'EndpointConfigs': []}
+    client.list_models.return_value = {'Models': []}
+    client.list_notebook_instances.return_value = {'NotebookInstances': []}
+    pages = {
+        'list_domains': [{'Domains': [{'DomainId': 'd-1'}]}],
+        'list_apps': [
+            {'Apps': []},
+            {'Apps': [{'AppName': 'jupyter', 'AppType': 'JupyterServer', 'Status': 'InService'}]},
+        ],
+        # Profiles span two pages; both must be deleted before the domain
+        'list_user_profiles': [
+            {'UserProfiles': [{'UserProfileName': 'alice'}]},
+            {'UserProfiles': [{'UserProfileName': 'bob'}]},
+        ],
+    }
+    client.get_paginator.side_effect = lambda op: MagicMock(**{'paginate.return_value': pages[op]})
+
+    cleaner = SageMakerCleaner(mock_session, Config(dry_run=False), {})
+    cleaner.cleanup('us-east-1')
+
+    assert [c.args for c in client.get_paginator.call_args_list].count(('list_domains',)) == 1
+    deleted = sorted(c.kwargs['UserProfileName'] for c in client.delete_user_profile.call_args_list)
+    assert deleted == ['alice', 'bob']
+    client.delete_app.assert_called_once_with(
+        DomainId='d-1', UserProfileName='', AppType='JupyterServer', AppName='jupyter'
+    )
+    client.delete_domain.assert_called_once_with(
+        DomainId='d-1', RetentionPolicy={'HomeEfsFileSystem': 'Delete'}
+    )
+
+def test_wait_notebook_stopped_reports_failed(mock_session, caplog):
+    client = MagicMock()
+    client.get_waiter.return_value.wait.side_effect = WaiterError(
+        'NotebookInstanceStopped', 'Waiter encountered a terminal failure state',
+        {'NotebookInstanceStatus': 'Failed'},
+    )
+
+    cleaner = SageMakerCleaner(mock_session, Config(dry_run=False), {})
+    with caplog.at_level('WARNING'):
+        cleaner._wait_notebook_stopped(client, 'nb-1', 'us-east-1')
+
+    assert [(r.levelname, r.getMessage()) for r in caplog.records] == [
+        ('ERROR', '[us-east-1] Notebook nb-1 failed to stop (Failed)'),
+    ]
@@ -0,0 +1,193 @@
+import pytest
+from unittest.mock import MagicMock
+from awswipe.resources.vpc import CLEANUP_STAGES, VPCCleaner
+from awswipe.core.config import Config
+
+@pytest.fixture
+def mock_session():
+    return MagicMock()
+
+@pytest.fixture
+def mock_config():
+    return Config(dry_run=False)
+
+def _mock_paginators(client, pages_by_operation):
+    def get_paginator(operation):
+        paginator = MagicMock()
+        paginator.paginate.return_value = pages_by_operation.get(operation, [])
+        return paginator
+    client.get_paginator.side_effect = get_paginator
+
+def test_delete_subnets(mock_session, mock_config):
+    ec2_client = MagicMock()
+    mock_session.client.return_value = ec2_client
+    _mock_paginators(ec2_client, {
+        'describe_subnets': [{'Subnets': [{'SubnetId': 'subnet-1'}, {'SubnetId': 'subnet-2'}]}],
+    })
+
+    report = {}
+    cleaner = VPCCleaner(mock_session, mock_config, report)
+    cleaner.delete_subnets('us-east-1')
+
+    deleted = sorted(call.kwargs['SubnetId'] for call in ec2_client.delete_subnet.call_args_list)
+    assert deleted == ['subnet-1', 'subnet-2']
+    assert sorted(report['Subnets']['deleted']) == ['subnet-1', 'subnet-2']
+
+def test_delete_vpcs_skips_default(mock_session, mock_config):
+    ec2_client = MagicMock()
+    mock_session.client.return_value = ec2_client
+    paginator = ec2_client.get_paginator.return_value
+    paginator.paginate.return_value = [{'Vpcs': [{'VpcId': 'vpc-1', 'IsDefault': False}]}]
+
+    cleaner = VPCCleaner(mock_session, mock_config, {})
+    cleaner.delete_vpcs('us-east-1')
+
+    # The default VPC is filtered out server-side
+    ec2_client.get_paginator.assert_called_once_with('describe_vpcs')
+    paginator.paginate.assert_called_once_with(Filters=[{'Name': 'is-default', 'Values': ['false']}])
+    ec2_client.delete_vpc.assert_called_once_with(VpcId='vpc-1')
+
+def test_cleanup_runs_stages_in_order(mock_session, mock_config, monkeypatch):
+    calls = []
+    cleaner = VPCCleaner(mock_session, mock_config, {})
+    for stage in CLEANUP_STAGES:
+        for step in stage:
+            monkeypatch.setattr(cleaner, step, lambda region, step=step: calls.append(step))
+
+    cleaner.cleanup('us-east-1')
+
+    stage_of = {step: i for i, stage in enumerate(CLEANUP_STAGES) for step in stage}
+    assert len(calls) == len(stage_of)
+    assert [stage_of[step] for step in calls] == sorted(stage_of[step] for step in calls)
+
+def test_delete_internet_gateways_detaches_first(mock_session, mock_config):
+    ec2_client = MagicMock()
+    mock_session.client.return_value = ec2_client
+    _mock_paginators(ec2_client, {
+        'describe_internet_gateways': [{'InternetGateways': [
+            {'InternetGatewayId': 'igw-1', 'Attachments': [{'VpcId': 'vpc-1'}]},
+            {'InternetGatewayId': 'igw-2', 'Attachments': []},
+        ]}],
+    })
+
+    report = {}
+    cleaner = VPCCleaner(mock_session, mock_config, report)
+    cleaner.delete_internet_gateways('us-east-1')
+
+    ec2_client.detach_internet_gateway.assert_called_once_with(InternetGatewayId='igw-1', VpcId='vpc-1')
+    assert ec2_client.delete_internet_gateway.call_count == 2
+    assert sorted(report['Internet Gateways']['deleted']) == ['igw-1', 'igw-2']
+
+def test_delete_nat_gateways_waits_for_deleted_ids(mock_session, mock_config):
+    ec2_client = MagicMock()
+    mock_session.client.return_value = ec2_client
+    _mock_paginators(ec2_client, {
+        'describe_nat_gateways': [{'NatGateways': [
+            {'NatGatewayId': 'nat-1'}, {'NatGatewayId': 'nat-2'},
+        ]}],
+    })
+
+    cleaner = VPCCleaner(mock_session, mock_config, {})
+    cleaner.delete_nat_gateways('us-east-1')
+
+    ec2_client.get_waiter.assert_called_once_with('nat_gateway_deleted')
+    wait_kwargs = ec2_client.get_waiter.return_value.wait.call_args.kwargs
+    assert sorted(wait_kwargs['NatGatewayIds']) == ['nat-1', 'nat-2']
+    assert wait_kwargs['WaiterConfig'] == {'Delay': 5, 'MaxAttempts': 60}
+
+def test_delete_security_groups_skips_empty_revokes(mock_session, mock_config):
+    ec2_client = MagicMock()
+    mock_session.client.return_value = ec2_client
+    rule = [{'IpProtocol': '-1'}]
+    _mock_paginators(ec2_client, {
+        'describe_security_groups': [{'SecurityGroups': [
+            {'GroupId': 'sg-default', 'GroupName': 'default', 'IpPermissions': rule},
+            {'GroupId': 'sg-1', 'GroupName': 'web', 'IpPermissions': rule, 'IpPermissionsEgress': []},
+            {'GroupId': 'sg-2', 'GroupName': 'db', 'IpPermissions': [], 'IpPermissionsEgress': rule},
+        ]}],
+    })
+
+    cleaner = VPCCleaner(mock_session, mock_config, {})
+    cleaner.delete_security_groups('us-east-1')
+
+    ec2_client.revoke_security_group_ingress.assert_called_once_with(GroupId='sg-1', IpPermissions=rule)
+    ec2_client.revoke_security_group_egress.assert_called_once_with(GroupId='sg-2', IpPermissions=rule)
+    deleted = sorted(call.kwargs['GroupId'] for call in ec2_client.delete_security_group.call_args_list)
+    assert deleted == ['sg-1', 'sg-2']
+
+def test_delete_route_tables_disassociates_before_delete(mock_session, mock_config):
+    ec2_client = MagicMock()
+    mock_session.client.return_value = ec2_client
+    _mock_paginators(ec2_client, {
+        'describe_route_tables': [{'RouteTables': [
+            {'RouteTableId': 'rtb-main', 'Associations': [{'RouteTableAssociationId': 'a-main', 'Main': True}]},
+            {'RouteTableId': 'rtb-1', 'Associations': [
+                {'RouteTableAssociationId': 'a-1', 'Main': False},
+                {'RouteTableAssociationId': 'a-2', 'Main': False},
+            ]},
+        ]}],
+    })
+    calls = []
+    ec2_client.disassociate_route_table.side_effect = lambda **kw: calls.append(kw['AssociationId'])
+    ec2_client.delete_route_table.side_effect = lambda **kw: calls.append(kw['RouteTableId'])
+
+    cleaner = VPCCleaner(mock_session, mock_config, {})
+    cleaner.delete_route_tables('us-east-1')
+
+    assert sorted(calls[:2]) == ['a-1', 'a-2']
+    assert calls[2:] == ['rtb-1']
+
+def test_delete_vpc_endpoints_batches_and_reads_unsuccessful(mock_session, mock_config):
+    ec2_client = MagicMock()
+    mock_session.client.return_value = ec2_client
+    ep_ids = [f"vpce-{i}" for i in range(30)]
+    _mock_paginators(ec2_client, {
+        'describe_vpc_endpoints': [{'VpcEndpoints': [{'VpcEndpointId': ep_id} for ep_id in ep_ids]}],
+    })
+
+    def delete_vpc_endpoints(VpcEndpointIds):
+        if 'vpce-3' in VpcEndpointIds:
+            return {'Unsuccessful': [{'ResourceId': 'vpce-3', 'Error': {'Code': 'InvalidState', 'Message': 'busy'}}]}
+        return {'Unsuccessful': []}
+    ec2_client.delete_vpc_endpoints.side_effect = delete_vpc_endpoints
+
+    report = {}
+    cleaner = VPCCleaner(mock_session, mock_config, report)
+    cleaner.delete_vpc_endpoints('us-east-1')
+
+    batch_sizes = sorted(len(call.kwargs['VpcEndpointIds']) for call in ec2_client.delete_vpc_endpoints.call_args_list)
+    assert batch_sizes == [5, 25]
+    assert len(report['VPC Endpoints']['deleted']) == 29
+    assert len(report['VPC Endpoints']['failed']) == 1
+
+def test_delete_network_acls_filters_default(mock_session, mock_config):
+    ec2_client = MagicMock()
+    mock_session.client.return_value = ec2_client
+    paginator = ec2_client.get_paginator.return_value
+    paginator.paginate.return_value = [{'NetworkAcls': [{'NetworkAclId': 'acl-1', 'IsDefault': False}]}]
+
+    cleaner = VPCCleaner(mock_session, mock_config, {})
+    cleaner.delete_network_acls('us-east-1')
+
+    paginator.paginate.assert_called_once_with(Filters=[{'Name': 'default', 'Values': ['false']}])
+    ec2_client.delete_network_acl.assert_called_once_with(NetworkAclId='acl-1')
+
+def test_cleanup_builds_one_ec2_client_per_region(mock_session, mock_config):
+    cleaner = VPCCleaner(mock_session, mock_config, {})
+    cleaner.cleanup('us-east-1')
+
+    assert mock_session.client.call_count == 1
+
+def test_dry_run_summary_only_logs_counts(mock_session, caplog):
+    ec2_client = MagicMock()
+    mock_session.client.return_value = ec2_client
+    _mock_paginators(ec2_client, {
+        'describe_subnets': [{'Subnets': [{'SubnetId': 'subnet-1'}, {'SubnetId': 'subnet-2'}]}],
+    })
+
+    cleaner = VPCCleaner(mock_session, Config(dry_run=True, dry_run_summary_only=True), {})
+    with caplog.at_level('INFO'):
+        cleaner.delete_subnets('us-east-1')
+
+    assert [r.getMessage() for r in caplog.records] == ['[Dry-Run] [us-east-1] Would delete 2 Subnets']
+    ec2_client.delete_subnet.assert_not_called()
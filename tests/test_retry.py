@@ -1,7 +1,8 @@
 import pytest
+from functools import partial
 from unittest.mock import MagicMock, patch
 from botocore.exceptions import ClientError
-from awswipe.core.retry import retry_delete, retry_delete_with_backoff
+from awswipe.core.retry import RETRY_ATTEMPTS, retry_delete, retry_delete_with_backoff
 
 def test_retry_delete_success():
     mock_op = MagicMock(return_value="success")
@@ -16,11 +17,26 @@ def test_retry_delete_throttling():
     
     mock_op = MagicMock(side_effect=[throttling_error, throttling_error, "success"])
     
-    with patch('time.sleep') as mock_sleep: # Don't actually sleep
+    with patch('time.sleep') as mock_sleep, \
+         patch('random.uniform', side_effect=lambda low, high: high) as mock_uniform:
         result = retry_delete(mock_op, "test op")
         
     assert result == "success"
     assert mock_op.call_count == 3
+    # Each sleep is drawn from [0, ceiling], with the ceiling doubling per attempt
+    assert [c.args for c in mock_uniform.call_args_list] == [(0, 1.2), (0, 2.4)]
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1.2, 2.4]
+
+def test_retry_delete_default_attempts_are_a_backstop():
+    # botocore's adaptive mode retries throttles first, so only a few outer attempts remain
+    throttling_error = ClientError({'Error': {'Code': 'Throttling'}}, 'test')
+    mock_op = MagicMock(side_effect=throttling_error)
+
+    with patch('time.sleep'):
+        with pytest.raises(Exception):
+            retry_delete(mock_op, "test op")
+
+    assert mock_op.call_count == RETRY_ATTEMPTS == 3
 
 def test_retry_delete_failure():
     error_response = {'Error': {'Code': 'SomeOtherError'}}
@@ -45,3 +61,30 @@ def test_retry_delete_max_retries():
     
     assert "Max retries (3) exceeded" in str(excinfo.value)
     assert mock_op.call_count == 3
+
+def test_retry_delete_modeled_throttle_exception():
+    class ThrottlingException(ClientError):
+        pass
+
+    class FakeClient:
+        class exceptions:
+            pass
+
+        def delete_thing(self, Name):
+            raise ThrottlingException({'Error': {'Code': 'SlowDown'}}, 'DeleteThing')
+
+    FakeClient.exceptions.ThrottlingException = ThrottlingException
+    client = FakeClient()
+
+    with patch('time.sleep') as mock_sleep:
+        with pytest.raises(Exception) as excinfo:
+            retry_delete(partial(client.delete_thing, Name='x'), "test op", max_attempts=2)
+
+    assert "Max retries (2) exceeded" in str(excinfo.value)
+    assert mock_sleep.call_count == 2
+
+def test_retry_delete_with_backoff_reports_outcome():
+    assert retry_delete_with_backoff(MagicMock(return_value={}), "test op") is True
+
+    other_error = ClientError({'Error': {'Code': 'SomeOtherError'}}, 'test')
+    assert retry_delete_with_backoff(MagicMock(side_effect=other_error), "test op") is False